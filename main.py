@@ -5,26 +5,188 @@ Root cause analysis tool for log files with focus on ticket selling and credit c
 """
 
 import os
+import re
 import sys
+import time
+import atexit
+import queue
+import hashlib
+import importlib
 import logging
 import argparse
+import concurrent.futures
+import multiprocessing
+import logging.handlers
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from file_scanner import LogFileScanner
-from log_parser import LogParser
-from data_analyzer import DataAnalyzer
-from report_generator import ReportGenerator
+from file_scanner import LogFileScanner, prefetch_files
+
+# Same retention as the Streamlit viewer's upload cache: parse cache entries
+# older than this or beyond the newest PARSE_CACHE_MAX_FILES are deleted
+PARSE_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+PARSE_CACHE_MAX_FILES = 8
+
+
+def _init_worker(log_queue, log_level, cpu_queue=None):
+    """
+    Set up a parser worker process.
+    
+    Routes the worker's log records to the main process's log queue and, when
+    a CPU queue is given, pins the worker to the next free CPU so workers
+    don't share caches or migrate between cores.
+    
+    Args:
+        log_queue (multiprocessing.Queue): Queue served by the main QueueListener
+        log_level (int): Logging level of the main process
+        cpu_queue (multiprocessing.Queue): Free CPU ids, one per worker (optional)
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+    
+    if cpu_queue is not None:
+        try:
+            cpu_id = cpu_queue.get(timeout=1)
+        except queue.Empty:
+            # A replacement worker after all CPUs were handed out; leave it unpinned
+            return
+        try:
+            os.sched_setaffinity(0, {cpu_id})
+        except OSError as e:
+            root_logger.debug("Could not pin worker %d to CPU %d: %s", os.getpid(), cpu_id, e)
+
+
+def _worker_cpu_queue(max_workers):
+    """
+    Build a queue of distinct CPU ids for pinning worker processes.
+    
+    Args:
+        max_workers (int): Number of worker processes
+        
+    Returns:
+        multiprocessing.Queue: Queue holding one CPU id per worker, or None when
+            pinning isn't supported or there are fewer usable CPUs than workers
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    
+    available_cpus = sorted(os.sched_getaffinity(0))
+    if len(available_cpus) < max_workers:
+        return None
+    
+    cpu_queue = multiprocessing.Queue()
+    for cpu_id in available_cpus[:max_workers]:
+        cpu_queue.put(cpu_id)
+    return cpu_queue
+
+
+def _build_date_filter(start_time, end_time):
+    """
+    Compile an anchored bytes pattern that rejects ISO-timestamped lines outside a window.
+    
+    Lines starting with an ISO date/time are kept only if it falls within
+    [start_time, end_time] (whole hours on a single day, as used by
+    DataAnalyzer). Lines in any other format are always kept and left to the
+    timeframe filter after parsing.
+    
+    Args:
+        start_time (datetime): Start of the window (on the hour)
+        end_time (datetime): End of the window (on the hour, inclusive)
+        
+    Returns:
+        re.Pattern: Compiled bytes pattern for LogParser(fast_date_filter=...)
+    """
+    day = start_time.strftime('%Y-%m-%d')
+    hours = '|'.join(f'{hour:02d}' for hour in range(start_time.hour, end_time.hour))
+    pattern = (
+        rf'^\s*(?:{day}[T ](?:{hours}):'
+        rf'|{day}[T ]{end_time.hour:02d}:00:00'
+        r'|(?!\d{4}-\d{2}-\d{2}[T ]\d{2}:))'
+    )
+    return re.compile(pattern.encode('ascii'))
+
+
+def _parse_file_batch(file_paths, max_lines=None, warnings_as_errors=False, tail_from=None,
+                      date_filter=None):
+    """
+    Parse a batch of log files inside a worker process.
+    
+    Defined at module level so it can be pickled by ProcessPoolExecutor; each
+    worker builds its own LogParser and returns one list per column, which is
+    much cheaper to send back and concatenate than a list of dictionaries.
+    
+    Args:
+        file_paths (list): Paths of the files in this batch
+        max_lines (int): Optional cap on lines parsed from each file
+        warnings_as_errors (bool): Treat warnings as errors for has_error flag
+        tail_from (datetime): Only parse the part of each file from this time onwards
+        date_filter (re.Pattern): Optional LogParser fast_date_filter
+        
+    Returns:
+        dict: Column name -> list of values, keyed by LogParser.RECORD_FIELDS
+    """
+    # Start readahead for the whole batch so I/O overlaps with parsing
+    prefetch_files(file_paths)
+    
+    from log_parser import LogParser
+    
+    parser = LogParser(treat_warnings_as_errors=warnings_as_errors, fast_date_filter=date_filter)
+    columns = {field: [] for field in LogParser.RECORD_FIELDS}
+    for file_path in file_paths:
+        parser.parse_file_columns(file_path, max_lines=max_lines, tail_from=tail_from, columns=columns)
+    
+    return columns
+
+
+def _batch_files_by_size(log_files, max_workers):
+    """
+    Bin-pack files into batches of roughly equal byte size.
+    
+    Small files are grouped together so process startup and result transfer
+    don't dominate, while large files end up in batches of their own.
+    
+    Args:
+        log_files (list): File metadata dictionaries from LogFileScanner
+        max_workers (int): Number of worker processes
+        
+    Returns:
+        list: List of batches, each a list of file paths
+    """
+    total_size = sum(f['file_size'] for f in log_files)
+    # Aim for a few batches per worker so stragglers even out
+    target_size = max(total_size // (max(max_workers, 1) * 4), 1)
+    
+    batches = []
+    current_batch = []
+    current_size = 0
+    
+    for file_info in sorted(log_files, key=lambda f: f['file_size'], reverse=True):
+        current_batch.append(file_info['file_path'])
+        current_size += file_info['file_size']
+        
+        if current_size >= target_size:
+            batches.append(current_batch)
+            current_batch = []
+            current_size = 0
+    
+    if current_batch:
+        batches.append(current_batch)
+    
+    return batches
+
 
 class LogAnalyzerApp:
     """Main application class that orchestrates the complete log analysis workflow."""
     
     def __init__(self, logs_dir: str = None, output_dir: str = None, target_date: datetime = None,
                  max_file_size_mb: int = 200, max_lines_per_file: int = None,
-                 warnings_as_errors: bool = False, no_time_filter: bool = False):
+                 warnings_as_errors: bool = False, no_time_filter: bool = False,
+                 use_cache: bool = True, use_arrow_csv: bool = True):
         """
         Initialize the log analyzer application.
         
@@ -36,11 +198,16 @@ class LogAnalyzerApp:
             max_lines_per_file (int): Optional cap on lines parsed from each file
             warnings_as_errors (bool): Count warnings as errors in totals
             no_time_filter (bool): Process all data without timeframe filtering
+            use_cache (bool): Reuse parsed DataFrames cached from earlier runs on unchanged files,
+                and cache newly parsed ones
+            use_arrow_csv (bool): Write the detailed CSV with PyArrow when it is installed
         """
         # Set up paths
         self.base_dir = Path(__file__).parent
         self.logs_dir = Path(logs_dir) if logs_dir else self.base_dir / 'logs'
         self.output_dir = Path(output_dir) if output_dir else self.base_dir / 'output'
+        self.cache_dir = self.output_dir / '.parse_cache'
+        self.use_cache = use_cache
         
         # Set target date (defaults to yesterday)
         self.target_date = target_date if target_date else datetime.now() - timedelta(days=1)
@@ -51,27 +218,62 @@ class LogAnalyzerApp:
         self.warnings_as_errors = warnings_as_errors
         self.no_time_filter = no_time_filter
         
-        # Initialize components
+        # Cheap anchored pre-check that lets the parser drop out-of-window lines unparsed
+        window_start = self.target_date.replace(hour=9, minute=0, second=0, microsecond=0)
+        window_end = self.target_date.replace(hour=14, minute=0, second=0, microsecond=0)
+        self._date_prefix_re = None if self.no_time_filter else _build_date_filter(window_start, window_end)
+        
+        # Initialize components (the pandas-based ones are created by
+        # _lazy_init_heavy once the scan has found something to analyze)
+        self.use_arrow_csv = use_arrow_csv
         self.scanner = LogFileScanner(str(self.logs_dir))
-        self.parser = LogParser(treat_warnings_as_errors=self.warnings_as_errors)
-        self.analyzer = DataAnalyzer(target_date=self.target_date, time_filter_enabled=not self.no_time_filter)
-        self.report_generator = ReportGenerator(str(self.output_dir))
+        self.parser = None
+        self.analyzer = None
+        self.report_generator = None
         
         # Set up logging
         self.setup_logging()
         
         logger = logging.getLogger(__name__)
-        logger.info(f"Log Analyzer initialized")
-        logger.info(f"Logs directory: {self.logs_dir}")
-        logger.info(f"Output directory: {self.output_dir}")
-        logger.info(f"Analysis date: {self.target_date.strftime('%Y-%m-%d')}")
-        logger.info(f"Max file size (MB): {self.max_file_size_mb}")
-        logger.info(f"Max lines per file: {self.max_lines_per_file if self.max_lines_per_file else 'No limit'}")
-        logger.info(f"Warnings as errors: {self.warnings_as_errors}")
-        logger.info(f"Time filter enabled: {not self.no_time_filter}")
+        logger.info("Log Analyzer initialized")
+        logger.info("Logs directory: %s", self.logs_dir)
+        logger.info("Output directory: %s", self.output_dir)
+        logger.info("Analysis date: %s", self.target_date.strftime('%Y-%m-%d'))
+        logger.info("Max file size (MB): %s", self.max_file_size_mb)
+        logger.info("Max lines per file: %s", self.max_lines_per_file if self.max_lines_per_file else 'No limit')
+        logger.info("Warnings as errors: %s", self.warnings_as_errors)
+        logger.info("Time filter enabled: %s", not self.no_time_filter)
+    
+    def _lazy_init_heavy(self):
+        """
+        Create the parser, analyzer and report generator on first use.
+        
+        Their modules pull in pandas, matplotlib and plotly, which take seconds
+        to import, so this is deferred until the scan has found log files.
+        """
+        if self.parser is not None:
+            return
+        
+        log_parser = importlib.import_module('log_parser')
+        data_analyzer = importlib.import_module('data_analyzer')
+        report_generator = importlib.import_module('report_generator')
+        
+        self.parser = log_parser.LogParser(treat_warnings_as_errors=self.warnings_as_errors,
+                                           fast_date_filter=self._date_prefix_re)
+        self.analyzer = data_analyzer.DataAnalyzer(target_date=self.target_date,
+                                                   time_filter_enabled=not self.no_time_filter)
+        self.report_generator = report_generator.ReportGenerator(str(self.output_dir),
+                                                                 use_arrow_csv=self.use_arrow_csv)
     
     def setup_logging(self):
-        """Set up logging configuration."""
+        """
+        Set up logging configuration.
+        
+        Records are put on a queue and written to the log file and stdout by a
+        background QueueListener, so logging never blocks the analysis on disk
+        or console I/O. The queue is a multiprocessing queue so parse workers
+        can log through it as well.
+        """
         # Create logs directory if it doesn't exist
         log_dir = self.output_dir / 'logs'
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -79,25 +281,64 @@ class LogAnalyzerApp:
         # Configure logging
         log_file = log_dir / f"log_analyzer_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(str(log_file)),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(str(log_file))
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        
+        self._log_queue = multiprocessing.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(self._log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        
+        # The queue handler only renders the message; the listener's handlers apply the full format
+        queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        
+        # basicConfig leaves an already configured root logger alone; only a
+        # handler installed here is removed again by shutdown_logging
+        self._queue_handler = queue_handler if queue_handler in logging.getLogger().handlers else None
+        
+        # Flush and stop the listener at exit if run_analysis never does
+        atexit.register(self.shutdown_logging)
+    
+    def shutdown_logging(self):
+        """
+        Flush queued log records and stop the background log listener.
+        
+        The queue handler is taken off the root logger first, so nothing is
+        queued once the listener is gone; run_analysis sets logging up again
+        if it is called another time.
+        """
+        if self._log_listener is None:
+            return
+        
+        if self._queue_handler is not None:
+            logging.getLogger().removeHandler(self._queue_handler)
+            self._queue_handler = None
+        
+        self._log_listener.stop()
+        self._log_listener = None
+        self._log_queue.close()
+        self._log_queue.join_thread()
+        atexit.unregister(self.shutdown_logging)
     
-    def run_analysis(self, max_workers: int = 4) -> dict:
+    def run_analysis(self, max_workers: int = None) -> dict:
         """
         Run the complete log analysis workflow.
         
         Args:
-            max_workers (int): Number of worker threads for parallel processing
+            max_workers (int): Number of worker processes for parallel parsing
+                (None for one per usable CPU)
             
         Returns:
             dict: Analysis results and file paths
         """
+        if self._log_listener is None:
+            self.setup_logging()  # Stopped by an earlier run
+        
         logger = logging.getLogger(__name__)
         
         try:
@@ -111,11 +352,13 @@ class LogAnalyzerApp:
             
             if not log_files:
                 logger.error("No log files found in the specified directory!")
-                logger.error(f"Please ensure log files (.log, .txt) are placed in: {self.logs_dir}")
+                logger.error("Please ensure log files (.log, .txt) are placed in: %s", self.logs_dir)
                 return {'success': False, 'error': 'No log files found'}
             
+            self._lazy_init_heavy()
+            
             file_summary = self.scanner.get_file_summary(log_files)
-            logger.info(f"Found {file_summary['total_files']} files ({file_summary['total_size_mb']} MB)")
+            logger.info("Found %d files (%s MB)", file_summary['total_files'], file_summary['total_size_mb'])
             
             # Optional: Filter out very large files to avoid long parse times
             if self.max_file_size_mb and self.max_file_size_mb > 0:
@@ -125,25 +368,58 @@ class LogAnalyzerApp:
                 after_count = len(log_files)
                 skipped = before_count - after_count
                 if skipped > 0:
-                    logger.warning(f"Skipping {skipped} file(s) larger than {self.max_file_size_mb} MB")
-            
-            # Step 2: Parse log files
-            logger.info("Step 2: Parsing log files...")
-            file_paths = [f['file_path'] for f in log_files]
+                    logger.warning("Skipping %d file(s) larger than %s MB", skipped, self.max_file_size_mb)
             
-            parsed_lines = self.parser.parse_files_parallel(
-                file_paths, max_workers=max_workers, max_lines_per_file=self.max_lines_per_file
-            )
+            # Skip files that cannot overlap the target window before paying to parse them
+            if not self.no_time_filter:
+                before_count = len(log_files)
+                log_files = self.scanner.filter_by_target_window(
+                    log_files, self.analyzer.start_time, self.analyzer.end_time
+                )
+                skipped = before_count - len(log_files)
+                if skipped > 0:
+                    logger.info("Skipping %d file(s) outside the target window", skipped)
+                
+                if not log_files:
+                    logger.warning("No log files overlap the target timeframe!")
+                    logger.warning("Target: %s to %s", self.analyzer.start_time, self.analyzer.end_time)
+                    return {'success': False, 'error': 'No data in target timeframe'}
             
-            if not parsed_lines:
-                logger.error("No parseable log entries found!")
-                return {'success': False, 'error': 'No parseable log entries found'}
+            # Step 2: Parse log files (or reuse the cached result for unchanged inputs)
+            logger.info("Step 2: Parsing log files...")
+            cache_path = self.get_parse_cache_path(log_files) if self.use_cache else None
+            df = self.parser.load_dataframe(cache_path) if cache_path and cache_path.exists() else None
             
-            logger.info(f"Parsed {len(parsed_lines):,} log entries")
+            if df is not None:
+                logger.info("Loaded %s parsed log entries from cache: %s", format(len(df), ","), cache_path)
+                try:
+                    os.utime(cache_path)  # Recently used entries are the last to be pruned
+                except OSError:
+                    pass
+            else:
+                logger.info("Error classification engine: %s", self.parser.engine)
+                parsed_columns = self.parse_files(log_files, max_workers=max_workers)
+                total_parsed = len(parsed_columns['timestamp'])
+                
+                if not total_parsed:
+                    logger.error("No parseable log entries found!")
+                    return {'success': False, 'error': 'No parseable log entries found'}
+                
+                logger.info("Parsed %s log entries", format(total_parsed, ","))
+                
+                # Convert to DataFrame (columns are handed over without a row-wise round-trip)
+                df = self.parser.to_dataframe(parsed_columns)
+                del parsed_columns
+                
+                # Categorical level/file columns keep the analyzer stages on integer codes
+                df = self.parser.optimize_dtypes(df)
+                
+                # --no-cache neither reads nor writes the cache
+                if self.use_cache:
+                    self.parser.save_dataframe(df, cache_path)
+                    self.prune_parse_cache()
             
-            # Convert to DataFrame
-            df = self.parser.to_dataframe(parsed_lines)
-            logger.info(f"Created DataFrame with {len(df)} rows, {len(df.columns)} columns")
+            logger.info("Created DataFrame with %d rows, %d columns", len(df), len(df.columns))
             
             # Step 3: Filter by timeframe (or skip if disabled)
             if self.no_time_filter:
@@ -155,71 +431,89 @@ class LogAnalyzerApp:
                 
                 if filtered_df.empty:
                     logger.warning("No log entries found in the target timeframe!")
-                    logger.warning(f"Target: {self.analyzer.start_time} to {self.analyzer.end_time}")
+                    logger.warning("Target: %s to %s", self.analyzer.start_time, self.analyzer.end_time)
                     return {'success': False, 'error': 'No data in target timeframe'}
                 
-                logger.info(f"Filtered to {len(filtered_df)} entries in target timeframe")
-            
-            # Step 4: Analyze data
-            logger.info("Step 4: Analyzing error patterns...")
-            analysis = self.analyzer.analyze_error_patterns(filtered_df)
-            peak_periods = self.analyzer.identify_peak_periods(filtered_df)
-            timeline_df = self.analyzer.generate_timeline(filtered_df)
-            summary_stats = self.analyzer.create_summary_stats(filtered_df, analysis)
-            
-            logger.info(f"Analysis complete: {analysis['total_errors']} errors found ({analysis['error_rate']:.1%} rate)")
-            if 'total_warnings' in analysis:
-                logger.info(f" - Strict errors: {analysis.get('total_errors_strict', 0)}")
-                logger.info(f" - Warnings: {analysis.get('total_warnings', 0)}")
-                logger.info(f" - Inclusive errors (errors + warnings if enabled): {analysis.get('total_errors', 0)}")
-            
-            # Step 5: Generate reports
-            logger.info("Step 5: Generating reports...")
-            
-            # CSV export
-            csv_path = self.report_generator.export_detailed_csv(filtered_df)
-            
-            # Executive summary
-            summary_path = self.report_generator.create_executive_summary(
-                summary_stats, analysis, peak_periods
-            )
-            
-            # Visualizations
-            visualization_paths = self.report_generator.create_visualizations(
-                filtered_df, analysis, timeline_df
-            )
-            
-            # Interactive dashboard
-            dashboard_path = self.report_generator.create_interactive_dashboard(
-                filtered_df, analysis, timeline_df
-            )
-            
-            # Step 6: Summary
-            logger.info("=" * 80)
-            logger.info("ANALYSIS COMPLETE!")
-            logger.info("=" * 80)
-            logger.info(f"📊 Log entries analyzed: {len(df):,}")
-            logger.info(f"🎯 Entries in target window: {len(filtered_df):,}")
-            logger.info(f"❌ Total errors found: {analysis['total_errors']:,}")
-            logger.info(f"📈 Error rate: {analysis['error_rate']:.1%}")
-            logger.info(f"⏰ Peak error period: {summary_stats.get('peak_error_hour', 'Not identified')}")
-            logger.info(f"💥 Error bursts: {summary_stats.get('error_bursts', 0)}")
-            logger.info(f"🔗 Cascading failures: {summary_stats.get('cascading_failures', 0)}")
+                logger.info("Filtered to %d entries in target timeframe", len(filtered_df))
             
-            if analysis.get('error_categories'):
-                logger.info("🏷️  Top error categories:")
-                for category, count in list(analysis['error_categories'].items())[:5]:
-                    logger.info(f"   • {category}: {count}")
-            
-            logger.info("=" * 80)
-            logger.info("OUTPUT FILES:")
-            logger.info("=" * 80)
-            logger.info(f"📋 Executive Summary: {summary_path}")
-            logger.info(f"📊 Detailed CSV: {csv_path}")
-            logger.info(f"🌐 Interactive Dashboard: {dashboard_path}")
+            # Report files don't depend on each other, so they are written on a
+            # small thread pool; the CSV export starts right away and overlaps
+            # the analysis below
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as io_pool:
+                # CSV export, plus a typed Parquet copy for re-loading the data
+                csv_future = io_pool.submit(self.report_generator.export_detailed_csv, filtered_df)
+                parquet_future = io_pool.submit(self.report_generator.export_detailed_parquet, filtered_df)
+                
+                # Step 4: Analyze data
+                logger.info("Step 4: Analyzing error patterns...")
+                minute_groups = self.analyzer.group_by_minute(filtered_df)
+                analysis = self.analyzer.analyze_error_patterns(filtered_df, minute_groups)
+                peak_periods = self.analyzer.identify_peak_periods_from_groups(filtered_df, minute_groups)
+                timeline_df = self.analyzer.generate_timeline_from_groups(minute_groups)
+                summary_stats = self.analyzer.create_summary_stats(filtered_df, analysis, peak_periods)
+                
+                logger.info("Analysis complete: %d errors found (%.1f%% rate)",
+                            analysis['total_errors'], analysis['error_rate'] * 100)
+                if 'total_warnings' in analysis:
+                    logger.info(" - Strict errors: %d", analysis.get('total_errors_strict', 0))
+                    logger.info(" - Warnings: %d", analysis.get('total_warnings', 0))
+                    logger.info(" - Inclusive errors (errors + warnings if enabled): %d", analysis.get('total_errors', 0))
+                
+                # Step 5: Generate reports
+                logger.info("Step 5: Generating reports...")
+                
+                # Executive summary
+                summary_future = io_pool.submit(
+                    self.report_generator.create_executive_summary, summary_stats, analysis, peak_periods
+                )
+                
+                # Charts are drawn from the aggregates only, never from the rows
+                plot_data = self.report_generator.build_plot_data(len(filtered_df), analysis, timeline_df)
+                
+                # Interactive dashboard
+                dashboard_future = io_pool.submit(
+                    self.report_generator.create_interactive_dashboard, plot_data, analysis
+                )
+                
+                # Visualizations (pyplot isn't thread-safe, so these stay on this thread)
+                visualization_paths = self.report_generator.create_visualizations(
+                    plot_data, analysis
+                )
+                
+                csv_path = csv_future.result()
+                parquet_path = parquet_future.result()
+                summary_path = summary_future.result()
+                dashboard_path = dashboard_future.result()
             
-            for viz_path in visualization_paths:
-                logger.info(f"📈 Chart: {viz_path}")
+            # Step 6: Summary (skip building the block entirely when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=" * 80)
+                logger.info("ANALYSIS COMPLETE!")
+                logger.info("=" * 80)
+                logger.info("📊 Log entries analyzed: %s", format(len(df), ","))
+                logger.info("🎯 Entries in target window: %s", format(len(filtered_df), ","))
+                logger.info("❌ Total errors found: %s", format(analysis['total_errors'], ","))
+                logger.info("📈 Error rate: %.1f%%", analysis['error_rate'] * 100)
+                logger.info("⏰ Peak error period: %s", summary_stats.get('peak_error_hour', 'Not identified'))
+                logger.info("💥 Error bursts: %d", summary_stats.get('error_bursts', 0))
+                logger.info("🔗 Cascading failures: %d", summary_stats.get('cascading_failures', 0))
+                
+                if analysis.get('error_categories'):
+                    logger.info("🏷️  Top error categories:")
+                    for category, count in list(analysis['error_categories'].items())[:5]:
+                        logger.info("   • %s: %d", category, count)
+                
+                logger.info("=" * 80)
+                logger.info("OUTPUT FILES:")
+                logger.info("=" * 80)
+                logger.info("📋 Executive Summary: %s", summary_path)
+                logger.info("📊 Detailed CSV: %s", csv_path)
+                if parquet_path:
+                    logger.info("📦 Detailed Parquet: %s", parquet_path)
+                logger.info("🌐 Interactive Dashboard: %s", dashboard_path)
+                
+                for viz_path in visualization_paths:
+                    logger.info("📈 Chart: %s", viz_path)
             
             return {
                 'success': True,
@@ -228,6 +522,7 @@ class LogAnalyzerApp:
                 'peak_periods': peak_periods,
                 'files': {
                     'csv': csv_path,
+                    'parquet': parquet_path,
                     'summary': summary_path,
                     'dashboard': dashboard_path,
                     'visualizations': visualization_paths
@@ -242,8 +537,133 @@ class LogAnalyzerApp:
             }
             
         except Exception as e:
-            logger.error(f"Analysis failed: {str(e)}", exc_info=True)
+            logger.error("Analysis failed: %s", e, exc_info=True)
             return {'success': False, 'error': str(e)}
+        
+        finally:
+            self.shutdown_logging()
+    
+    def get_parse_cache_path(self, log_files: list) -> Path:
+        """
+        Build the cache file path for parsing the given files with the current settings.
+        
+        The key covers every input that changes the parsed DataFrame: the
+        parser version, the parsing options, and each file's path, size and
+        modification time.
+        
+        Args:
+            log_files (list): File metadata dictionaries from LogFileScanner
+            
+        Returns:
+            Path: Parquet file path inside the cache directory
+        """
+        key_parts = [
+            self.parser.PARSER_VERSION,
+            self.warnings_as_errors,
+            self.max_lines_per_file,
+            self.no_time_filter,
+            self.target_date.strftime('%Y-%m-%d'),
+        ]
+        key_parts.extend(sorted(
+            (f['file_path'], f['file_size'], f['modified_time'].timestamp()) for f in log_files
+        ))
+        
+        digest = hashlib.blake2b(repr(key_parts).encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.parquet"
+    
+    def prune_parse_cache(self):
+        """
+        Delete parse cache entries past PARSE_CACHE_MAX_AGE or beyond the newest
+        PARSE_CACHE_MAX_FILES, along with temporary files left by interrupted writes.
+        """
+        now = time.time()
+        current = []
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return
+        
+        for entry in entries:
+            try:
+                mtime = entry.stat().st_mtime
+                if entry.name.endswith('.parquet') and now - mtime < PARSE_CACHE_MAX_AGE:
+                    current.append((mtime, entry.path))
+                elif entry.name.endswith('.parquet') or now - mtime >= PARSE_CACHE_MAX_AGE:
+                    os.remove(entry.path)  # Expired, or a temp file left by a crash
+            except OSError:
+                pass
+        
+        current.sort(reverse=True)
+        for _, path in current[PARSE_CACHE_MAX_FILES:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def parse_files(self, log_files: list, max_workers: int = None) -> Dict[str, list]:
+        """
+        Parse log files in parallel worker processes.
+        
+        Regex parsing is CPU-bound, so a process pool is used instead of
+        threads to get past the GIL. Files are bin-packed by size into batches
+        and results are collected in batch order.
+        
+        Args:
+            log_files (list): File metadata dictionaries from LogFileScanner
+            max_workers (int): Number of worker processes (None for one per usable CPU)
+            
+        Returns:
+            dict: Column name -> list of values, keyed by LogParser.RECORD_FIELDS
+        """
+        logger = logging.getLogger(__name__)
+        
+        if not max_workers:
+            from log_parser import usable_cpu_count
+            max_workers = usable_cpu_count()
+        
+        # With a time filter, entries older than an hour before the window are
+        # never used, so workers skip the head of each file
+        tail_from = None if self.no_time_filter else self.analyzer.start_time - timedelta(hours=1)
+        
+        batches = _batch_files_by_size(log_files, max_workers)
+        batch_results = [None] * len(batches)
+        
+        if max_workers <= 1 or len(batches) <= 1:
+            # Not worth spawning processes for a single batch
+            for i, batch in enumerate(batches):
+                batch_results[i] = _parse_file_batch(batch, self.max_lines_per_file, self.warnings_as_errors,
+                                                     tail_from, self._date_prefix_re)
+        else:
+            cpu_queue = _worker_cpu_queue(max_workers)
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self._log_queue, logging.getLogger().level, cpu_queue)
+            ) as executor:
+                future_to_batch = {
+                    executor.submit(_parse_file_batch, batch, self.max_lines_per_file,
+                                    self.warnings_as_errors, tail_from, self._date_prefix_re): i
+                    for i, batch in enumerate(batches)
+                }
+                
+                for future in concurrent.futures.as_completed(future_to_batch):
+                    i = future_to_batch[future]
+                    try:
+                        batch_results[i] = future.result()
+                    except Exception as e:
+                        logger.error("Error parsing files %s: %s", batches[i], e)
+        
+        # Concatenate column-wise, releasing each batch as soon as it is merged
+        parsed_columns = {field: [] for field in self.parser.RECORD_FIELDS}
+        for i, columns in enumerate(batch_results):
+            if columns:
+                for field in self.parser.RECORD_FIELDS:
+                    parsed_columns[field].extend(columns[field])
+            batch_results[i] = None
+        
+        logger.info("Parsed total of %d lines from %d files in %d batches",
+                    len(parsed_columns['timestamp']), len(log_files), len(batches))
+        return parsed_columns
 
 
 def main():
@@ -280,8 +700,8 @@ Examples:
     parser.add_argument(
         '--workers', 
         type=int, 
-        default=4, 
-        help='Number of worker threads for parallel processing (default: 4)'
+        default=None, 
+        help='Number of worker processes for parallel parsing (default: one per usable CPU)'
     )
 
     parser.add_argument(
@@ -295,7 +715,8 @@ Examples:
         '--max-lines-per-file',
         type=int,
         default=None,
-        help='Maximum number of lines to parse from each file (default: no limit)'
+        help='Maximum number of lines to parse from each file, counted from the first line read '
+             '(default: no limit)'
     )
 
     parser.add_argument(
@@ -310,6 +731,12 @@ Examples:
         help='Process all data without applying the 9:00-14:00 timeframe filter'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-parse log files, without reading or writing the parse cache'
+    )
+    
     parser.add_argument(
         '--verbose', '-v', 
         action='store_true', 
@@ -348,7 +775,8 @@ Examples:
         max_file_size_mb=args.max_file_size_mb,
         max_lines_per_file=args.max_lines_per_file,
         warnings_as_errors=args.warnings_as_errors,
-        no_time_filter=args.no_time_filter
+        no_time_filter=args.no_time_filter,
+        use_cache=not args.no_cache
     )
     
     results = app.run_analysis(max_workers=args.workers)
@@ -11,18 +11,28 @@ from typing import Dict, List, Tuple, Optional
 import logging
 from collections import Counter
 
+try:
+    import polars as pl  # Optional: faster category/time-bin aggregation
+except ImportError:
+    pl = None
+
 logger = logging.getLogger(__name__)
 
+NS_PER_MINUTE = 60 * 1_000_000_000
+
 class DataAnalyzer:
     """Handles analysis of parsed log data with filtering and aggregation."""
     
-    def __init__(self, target_date: datetime = None, time_filter_enabled: bool = True):
+    def __init__(self, target_date: datetime = None, time_filter_enabled: bool = True,
+                 use_polars: bool = True):
         """
         Initialize analyzer with target analysis date.
         
         Args:
             target_date (datetime): The date to analyze (defaults to yesterday)
             time_filter_enabled (bool): Whether to apply the 9 AM - 2 PM timeframe filter
+            use_polars (bool): Aggregate error frequencies with Polars when it
+                is installed
         """
         if target_date is None:
             self.target_date = datetime.now() - timedelta(days=1)
@@ -30,13 +40,110 @@ class DataAnalyzer:
             self.target_date = target_date
         
         self.time_filter_enabled = time_filter_enabled
+        self.use_polars = use_polars and pl is not None
         
         # Define the critical time window (9 AM - 2 PM)
         self.start_time = self.target_date.replace(hour=9, minute=0, second=0, microsecond=0)
         self.end_time = self.target_date.replace(hour=14, minute=0, second=0, microsecond=0)
         
+        # Per-DataFrame intermediates shared by the analysis steps (see _prepare)
+        self._prepared_df = None
+        self._error_mask = None
+        self._error_df = None
+        self._time_bin_5m = None
+        self._exploded = None
+        
         logger.info(f"Analysis window: {self.start_time} to {self.end_time}")
     
+    def _prepare(self, df: pd.DataFrame):
+        """
+        Compute the error subset of a DataFrame once for all analysis steps.
+        
+        Results are cached for the DataFrame object last passed in; a different
+        frame recomputes them. Frames must not be modified in place between
+        analysis calls.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame
+        """
+        if self._prepared_df is df:
+            return
+        
+        self._prepared_df = df
+        self._error_mask = df['has_error'] == True
+        self._error_df = df[self._error_mask]
+        self._time_bin_5m = self._time_bins(self._error_df['timestamp'], 5)
+        self._exploded = None  # Built on first use by _exploded_categories
+    
+    def _exploded_categories(self) -> pd.DataFrame:
+        """
+        Flatten the prepared error rows into one row per (entry, category).
+        
+        Built once per prepared DataFrame; the 5-minute bin of each row is kept
+        in a time_bin column.
+        
+        Returns:
+            pd.DataFrame: Error rows with a 'category' column instead of 'error_categories'
+        """
+        if self._exploded is None:
+            columns = [col for col in ('timestamp', 'file_path', 'transaction_id', 'error_categories')
+                       if col in self._error_df.columns]
+            exploded = self._error_df[columns].assign(time_bin=self._time_bin_5m)
+            exploded = exploded.explode('error_categories').dropna(subset=['error_categories'])
+            self._exploded = exploded.rename(columns={'error_categories': 'category'})
+        return self._exploded
+    
+    def _time_bins(self, timestamps: pd.Series, minutes: int) -> pd.Series:
+        """
+        Number timestamps by fixed-width time bin with one int64 floor division.
+        
+        Grouping on these integer bin numbers is much cheaper than flooring to
+        datetime64 and grouping on that; use _bin_starts to turn the (few)
+        resulting bins back into timestamps.
+        
+        Args:
+            timestamps (pd.Series): datetime64 timestamps
+            minutes (int): Bin width in minutes
+            
+        Returns:
+            pd.Series: Bin numbers since the epoch (missing where the timestamp is NaT)
+        """
+        values = timestamps.to_numpy(dtype='datetime64[ns]')
+        bins = values.view('i8') // (minutes * NS_PER_MINUTE)
+        missing = np.isnat(values)
+        if missing.any():
+            bins = pd.arrays.IntegerArray(bins, missing)
+        return pd.Series(bins, index=timestamps.index, name='time_bin')
+    
+    def _bin_starts(self, bins, minutes: int) -> pd.DatetimeIndex:
+        """
+        Convert bin numbers from _time_bins back to the bins' start timestamps.
+        
+        Args:
+            bins: Bin numbers
+            minutes (int): Bin width in minutes
+            
+        Returns:
+            pd.DatetimeIndex: Start time of each bin
+        """
+        return pd.to_datetime(np.asarray(bins, dtype='i8') * (minutes * NS_PER_MINUTE))
+    
+    def _error_rates(self, total_errors: pd.Series, total_logs: pd.Series) -> np.ndarray:
+        """
+        Compute the error rate of each timeline bin in percent.
+        
+        Args:
+            total_errors (pd.Series): Errors per bin
+            total_logs (pd.Series): Log entries per bin
+            
+        Returns:
+            np.ndarray: Error rate per bin (0.0 for bins without entries)
+        """
+        errors = total_errors.to_numpy(dtype='float64')
+        logs = total_logs.to_numpy(dtype='float64')
+        rates = np.divide(errors, logs, out=np.zeros_like(errors), where=logs > 0)
+        return rates * 100
+    
     def filter_by_timeframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Filter DataFrame to only include logs within the target timeframe.
@@ -51,15 +158,36 @@ class DataAnalyzer:
             logger.warning("DataFrame is empty or missing timestamp column")
             return df
         
-        # Convert timestamp to datetime if not already
-        df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-        
-        # Remove rows with invalid timestamps
-        df = df.dropna(subset=['timestamp'])
-        
-        # Filter by time window
-        mask = (df['timestamp'] >= self.start_time) & (df['timestamp'] <= self.end_time)
-        filtered_df = df[mask].copy()
+        # Convert timestamp to datetime if not already (parsed frames arrive as
+        # datetime64 already; this is only needed for e.g. CSV-loaded data).
+        # The shallow copy keeps the caller's frame unmodified without copying
+        # the other columns.
+        if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            df = df.copy(deep=False)
+            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+        
+        # Neither branch copies the data: the filtered frame is a slice or a
+        # fresh boolean-indexed frame, and it is never modified in place
+        if df['timestamp'].is_monotonic_increasing:
+            # Sorted without NaT: the window is one contiguous slice
+            lo = df['timestamp'].searchsorted(self.start_time, side='left')
+            hi = df['timestamp'].searchsorted(self.end_time, side='right')
+            filtered_df = df.iloc[lo:hi]
+        else:
+            # Remove rows with invalid timestamps
+            df = df.dropna(subset=['timestamp'])
+            
+            # Filter by time window
+            mask = (df['timestamp'] >= self.start_time) & (df['timestamp'] <= self.end_time)
+            filtered_df = df[mask]
+        
+        # Low-cardinality string columns are grouped and counted repeatedly
+        # downstream; categorical codes hash much faster than strings
+        to_category = {col: 'category' for col in ('log_level', 'file_path')
+                       if col in filtered_df.columns
+                       and not isinstance(filtered_df[col].dtype, pd.CategoricalDtype)}
+        if to_category:
+            filtered_df = filtered_df.astype(to_category, copy=False)
         
         logger.info(f"Timeframe filter: {len(df)} -> {len(filtered_df)} rows "
                    f"({self.start_time.strftime('%H:%M')} - {self.end_time.strftime('%H:%M')})")
@@ -79,126 +207,368 @@ class DataAnalyzer:
         if df.empty:
             return pd.DataFrame()
         
-        # Create time bins (5-minute intervals)
-        df['time_bin'] = df['timestamp'].dt.floor('5T')
-        
-        # Flatten error categories and count them
-        error_data = []
-        for _, row in df.iterrows():
-            if row['error_categories']:
-                for category in row['error_categories']:
-                    error_data.append({
-                        'timestamp': row['timestamp'],
-                        'time_bin': row['time_bin'],
-                        'category': category,
-                        'file_path': row['file_path'],
-                        'transaction_id': row.get('transaction_id'),
-                        'log_level': row['log_level']
-                    })
-        
-        if not error_data:
+        # Flatten error categories into one row per (entry, category); only
+        # error rows can carry categories
+        self._prepare(df)
+        if self.use_polars and self._exploded is None:
+            try:
+                return self._error_frequencies_polars(df)
+            except Exception as e:
+                logger.warning(f"Polars error frequency aggregation failed, falling back to pandas: {e}")
+                self.use_polars = False
+        exploded = self._exploded_categories()
+        
+        if exploded.empty:
             logger.info("No errors found in the timeframe")
             return pd.DataFrame()
         
-        error_df = pd.DataFrame(error_data)
+        if 'transaction_id' not in exploded.columns:
+            exploded = exploded.assign(transaction_id=None)
         
-        # Calculate frequencies
-        frequency_summary = error_df.groupby(['category', 'time_bin']).agg({
-            'category': 'count',
-            'transaction_id': 'nunique',
-            'file_path': lambda x: list(set(x))
-        }).rename(columns={'category': 'count', 'transaction_id': 'unique_transactions'})
+        # Calculate frequencies; the file lists are gathered from pre-deduplicated
+        # rows so no per-group Python set has to be built
+        keys = ['category', 'time_bin']
+        frequency_summary = exploded.groupby(keys, observed=True).agg(
+            count=('category', 'size'),
+            unique_transactions=('transaction_id', 'nunique')
+        )
+        unique_files = exploded.drop_duplicates(keys + ['file_path'])
+        frequency_summary['file_path'] = unique_files.groupby(keys, observed=True, sort=False)['file_path'].agg(list)
+        frequency_summary = frequency_summary.reset_index()
+        frequency_summary['time_bin'] = self._bin_starts(frequency_summary['time_bin'], 5)
         
-        return frequency_summary.reset_index()
+        return frequency_summary
     
-    def identify_peak_periods(self, df: pd.DataFrame, window_minutes: int = 5) -> List[Dict]:
+    def _error_frequencies_polars(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Identify time periods with highest error activity.
+        Polars version of the calculate_error_frequencies aggregation.
+        
+        The explode, group and per-group distinct counts run in Polars' native
+        hash tables instead of pandas' object-dtype paths; only the (small)
+        result is converted back to pandas.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame (already passed through _prepare)
+            
+        Returns:
+            pd.DataFrame: Error frequency summary
+        """
+        columns = [col for col in ('file_path', 'transaction_id', 'error_categories') if col in df.columns]
+        errors = pl.from_pandas(self._error_df[columns].assign(time_bin=self._time_bin_5m))
+        if 'transaction_id' not in errors.columns:
+            errors = errors.with_columns(pl.lit(None, dtype=pl.Utf8).alias('transaction_id'))
+        
+        summary = (
+            errors.lazy()
+            .explode('error_categories')
+            .drop_nulls(['error_categories', 'time_bin'])
+            .group_by(['error_categories', 'time_bin'])
+            .agg(
+                pl.len().alias('count'),
+                pl.col('transaction_id').drop_nulls().n_unique().alias('unique_transactions'),
+                pl.col('file_path').cast(pl.Utf8).unique().alias('file_path')
+            )
+            .sort(['error_categories', 'time_bin'])
+            .rename({'error_categories': 'category'})
+            .collect()
+        )
+        
+        if summary.is_empty():
+            logger.info("No errors found in the timeframe")
+            return pd.DataFrame()
+        
+        frequency_summary = pd.DataFrame(summary.to_dict(as_series=False))
+        frequency_summary['time_bin'] = self._bin_starts(frequency_summary['time_bin'], 5)
+        
+        return frequency_summary
+    
+    def group_by_minute(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Count log entries per one-minute bucket in vectorized groupby passes.
+        
+        Only counts are kept per minute, so the coarser views used by the analysis
+        steps (1-minute bursts, 15-minute timeline, hourly peak) are rolled up
+        from this table with plain sums. Distinct files and transactions can't be
+        summed; they are counted from the error rows, and only for the peak
+        periods (see identify_peak_periods_from_groups).
         
         Args:
             df (pd.DataFrame): Input DataFrame
-            window_minutes (int): Time window size in minutes
             
         Returns:
-            list: List of peak period information
+            pd.DataFrame: Per-minute counts indexed by minute: total_logs,
+                total_errors, one 'level:<LEVEL>' column per log level and one
+                'category:<category>' column per error category
         """
         if df.empty or 'timestamp' not in df.columns:
-            return []
+            return pd.DataFrame()
         
-        # Create time bins
-        df['time_bin'] = df['timestamp'].dt.floor(f'{window_minutes}T')
+        self._prepare(df)
+        minutes = self._time_bins(df['timestamp'], 1).rename('minute')
+        grouped = self._error_mask.groupby(minutes, observed=True)
+        counts = [grouped.size().rename('total_logs'), grouped.sum().rename('total_errors')]
         
-        # Count errors per time bin
-        error_counts = df[df['has_error'] == True].groupby('time_bin').agg({
-            'has_error': 'count',
-            'error_categories': lambda x: [cat for sublist in x for cat in sublist],
-            'file_path': lambda x: list(set(x)),
-            'transaction_id': lambda x: list(set([tid for tid in x if tid is not None]))
-        }).rename(columns={'has_error': 'error_count'})
+        if 'log_level' in df.columns:
+            level_counts = df['log_level'].groupby([minutes, df['log_level']], observed=True).size()
+            counts.append(level_counts.unstack(fill_value=0).rename(columns=lambda level: f'level:{level}'))
         
-        if error_counts.empty:
-            return []
+        categories = pd.DataFrame({
+            'minute': minutes[self._error_mask],
+            'category': self._error_df['error_categories']
+        }).explode('category')
+        category_counts = categories.groupby(['minute', 'category'], observed=True).size()
+        counts.append(category_counts.unstack(fill_value=0).rename(columns=lambda category: f'category:{category}'))
+        
+        minute_groups = pd.concat(counts, axis=1).fillna(0).astype('int64')
+        minute_groups.index = self._bin_starts(minute_groups.index, 1).rename('minute')
         
-        # Find top 5 peak periods
-        top_periods = error_counts.nlargest(5, 'error_count')
+        return minute_groups
+    
+    def _merge_minute_groups(self, minute_groups: pd.DataFrame, interval_minutes: int) -> pd.DataFrame:
+        """Roll per-minute counts up into coarser time bins."""
+        return minute_groups.groupby(minute_groups.index.floor(f'{interval_minutes}min').rename('time_bin')).sum()
+    
+    def _count_dicts(self, counts: pd.DataFrame, prefix: str) -> List[Dict]:
+        """
+        Turn the prefixed count columns of a rolled-up table into one dict per row.
         
+        Args:
+            counts (pd.DataFrame): Output of group_by_minute or _merge_minute_groups
+            prefix (str): Column prefix, e.g. 'level:'
+            
+        Returns:
+            list: Name -> count dicts, most frequent first, without zero counts
+        """
+        columns = [col for col in counts.columns if col.startswith(prefix)]
+        names = [col[len(prefix):] for col in columns]
+        values = counts[columns].to_numpy()
+        order = np.argsort(-values, axis=1, kind='stable')
+        return [{names[j]: int(row[j]) for j in row_order if row[j] > 0}
+                for row, row_order in zip(values, order)]
+    
+    def _format_peak_periods(self, top_periods: pd.DataFrame, window_minutes: int) -> List[Dict]:
+        """Build peak period records from the top error time bins."""
         peak_periods = []
+        window = timedelta(minutes=window_minutes)
+        time_format = '%H:%M'
         for time_bin, data in top_periods.iterrows():
             category_counts = Counter(data['error_categories'])
             
             peak_periods.append({
-                'time_period': f"{time_bin.strftime('%H:%M')} - {(time_bin + timedelta(minutes=window_minutes)).strftime('%H:%M')}",
+                'time_period': f"{time_bin.strftime(time_format)} - {(time_bin + window).strftime(time_format)}",
                 'start_time': time_bin,
                 'error_count': data['error_count'],
                 'top_error_categories': dict(category_counts.most_common(3)),
-                'affected_files': len(data['file_path']),
-                'unique_transactions': len([t for t in data['transaction_id'] if t])
+                'affected_files': data['affected_files'],
+                'unique_transactions': data['unique_transactions']
             })
         
         return peak_periods
     
-    def analyze_error_patterns(self, df: pd.DataFrame) -> Dict:
+    def _peak_period_details(self, time_bins: pd.Series, top_counts: pd.Series, window_minutes: int) -> List[Dict]:
         """
-        Analyze patterns in error data.
+        Build peak period records for the winning bins from the error rows.
+        
+        Args:
+            time_bins (pd.Series): Bin number of every error row (from _time_bins)
+            top_counts (pd.Series): Error count per winning bin number, best first
+            window_minutes (int): Time window size in minutes
+            
+        Returns:
+            list: List of peak period information
+        """
+        # The per-bin details are only needed for the winning bins
+        error_df = self._error_df
+        in_top = time_bins.isin(top_counts.index)
+        grouped = error_df[in_top].groupby(time_bins[in_top], observed=True, sort=False)
+        
+        # Categories come from the flattened rows, already one category per row
+        exploded = self._exploded_categories()
+        if window_minutes != 5:
+            exploded = exploded.assign(time_bin=self._time_bins(exploded['timestamp'], window_minutes).array)
+        top_rows = exploded[exploded['time_bin'].isin(top_counts.index)]
+        categories = top_rows.groupby('time_bin', observed=True, sort=False)['category'].agg(list)
+        
+        top_periods = pd.DataFrame({
+            'error_count': top_counts,
+            'error_categories': categories,
+            'affected_files': grouped['file_path'].nunique(),
+            'unique_transactions': grouped['transaction_id'].nunique()
+        }).loc[top_counts.index]
+        # A bin whose errors carry no categories has no flattened rows
+        top_periods['error_categories'] = [cats if isinstance(cats, list) else []
+                                           for cats in top_periods['error_categories']]
+        top_periods.index = self._bin_starts(top_periods.index, window_minutes)
+        
+        return self._format_peak_periods(top_periods, window_minutes)
+    
+    def _error_time_bins(self, window_minutes: int) -> pd.Series:
+        """Bin numbers of the prepared error rows (the 5-minute bins are cached)."""
+        if window_minutes == 5:
+            return self._time_bin_5m
+        return self._time_bins(self._error_df['timestamp'], window_minutes)
+    
+    def identify_peak_periods(self, df: pd.DataFrame, window_minutes: int = 5) -> List[Dict]:
+        """
+        Identify time periods with highest error activity.
         
         Args:
             df (pd.DataFrame): Input DataFrame
+            window_minutes (int): Time window size in minutes
             
         Returns:
-            dict: Pattern analysis results
+            list: List of peak period information
         """
-        if df.empty:
-            return {'total_errors': 0, 'error_categories': {}, 'patterns': [], 'total_warnings': 0, 'total_errors_strict': 0}
+        if df.empty or 'timestamp' not in df.columns:
+            return []
+        
+        # Create time bins for the error rows
+        self._prepare(df)
+        time_bins = self._error_time_bins(window_minutes)
+        
+        # Count errors per time bin and find the top 5 peak periods
+        error_counts = time_bins.groupby(time_bins, observed=True).size()
+        if error_counts.empty:
+            return []
+        top_counts = error_counts.nlargest(5)
+        
+        return self._peak_period_details(time_bins, top_counts, window_minutes)
+    
+    def identify_peak_periods_from_groups(self, df: pd.DataFrame, minute_groups: pd.DataFrame,
+                                          window_minutes: int = 5) -> List[Dict]:
+        """
+        Identify time periods with highest error activity from per-minute counts.
+        
+        The busiest bins are found by rolling up the minute counts; categories,
+        files and transactions are then gathered from df's error rows in just
+        those bins.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            minute_groups (pd.DataFrame): Output of group_by_minute for df
+            window_minutes (int): Time window size in minutes
+            
+        Returns:
+            list: List of peak period information
+        """
+        if minute_groups.empty:
+            return []
+        
+        error_minutes = minute_groups.loc[minute_groups['total_errors'] > 0, 'total_errors']
+        if error_minutes.empty:
+            return []
+        
+        # Count errors per time bin and find the top 5 peak periods
+        window_ns = window_minutes * NS_PER_MINUTE
+        error_counts = error_minutes.groupby(error_minutes.index.asi8 // window_ns).sum()
+        top_counts = error_counts.nlargest(5)
+        
+        self._prepare(df)
+        return self._peak_period_details(self._error_time_bins(window_minutes), top_counts, window_minutes)
+    
+    def _value_counts(self, values: pd.Series) -> Dict:
+        """
+        Count the non-null values of a column in one vectorized pass.
         
-        error_df = df[df['has_error'] == True]
+        Both categorical and other columns are counted with a bincount over
+        integer codes: the categorical codes, or hash-based factorize codes
+        (no sorting of the values, unlike np.unique).
         
-        # Count errors by category
-        all_categories = [cat for cats in error_df['error_categories'] for cat in cats]
-        category_counts = Counter(all_categories)
+        Args:
+            values (pd.Series): Column to count
+            
+        Returns:
+            dict: Value -> count, most frequent first (ties in category order for
+                categorical columns, in order of first appearance otherwise)
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            uniques = values.cat.categories
+        else:
+            codes, uniques = pd.factorize(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
         
-        # Count errors by log level
-        level_counts = error_df['log_level'].value_counts().to_dict()
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        return dict(zip(np.asarray(uniques, dtype=object)[order].tolist(), counts[order].tolist()))
+    
+    def analyze_error_patterns(self, df: pd.DataFrame, minute_groups: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Analyze patterns in error data.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            minute_groups (pd.DataFrame): Output of group_by_minute for df (optional);
+                when given, the temporal patterns are rolled up from it instead of
+                regrouping the error rows
+            
+        Returns:
+            dict: Pattern analysis results
+        """
+        if df.empty:
+            return {'total_errors': 0, 'error_categories': {}, 'error_categories_counter': Counter(),
+                    'patterns': [], 'total_warnings': 0, 'total_errors_strict': 0}
         
-        # Count errors by file
-        file_counts = error_df['file_path'].value_counts().head(10).to_dict()
+        self._prepare(df)
+        error_df = self._error_df
         
         # Totals for delineation
         total_warnings = int(df['is_warning'].sum()) if 'is_warning' in df.columns else 0
         total_errors_strict = int(df['is_error_strict'].sum()) if 'is_error_strict' in df.columns else len(error_df)
         
+        # Nothing to break down on an error-free day
+        if error_df.empty:
+            return {
+                'total_errors': 0,
+                'total_log_entries': len(df),
+                'error_rate': 0.0,
+                'error_categories': {},
+                'error_categories_counter': Counter(),
+                'error_levels': {},
+                'top_error_files': {},
+                'peak_hour': None,
+                'unique_transactions_with_errors': 0,
+                'patterns': [],
+                'total_warnings': total_warnings,
+                'total_errors_strict': total_errors_strict
+            }
+        
+        # Count errors by category (the flattened rows are shared with the
+        # frequency and peak period steps)
+        category_counts = self._exploded_categories()['category'].value_counts(sort=False)
+        
+        # Count errors by log level, file and transaction
+        level_counts = self._value_counts(error_df['log_level'])
+        file_counts = dict(list(self._value_counts(error_df['file_path']).items())[:10])
+        transaction_counts = self._value_counts(error_df['transaction_id'])
+        
         # Analyze temporal patterns
-        hourly_counts = error_df.set_index('timestamp').resample('H')['has_error'].count()
-        peak_hour = hourly_counts.idxmax() if not hourly_counts.empty else None
+        if minute_groups is not None:
+            error_minutes = minute_groups.loc[minute_groups['total_errors'] > 0, 'total_errors'] \
+                if not minute_groups.empty else pd.Series(dtype='int64')
+            hourly_counts = error_minutes.groupby(error_minutes.index.floor('h'), observed=True).sum()
+            peak_hour = hourly_counts.idxmax() if not hourly_counts.empty else None
+        else:
+            # Minute and hour numbers both come from one int64 pass over the
+            # timestamps. Histogram of hour numbers; argmax picks the earliest
+            # busiest hour like idxmax over resample('h') did
+            minute_bins = self._time_bins(error_df['timestamp'], 1).dropna().to_numpy(dtype='i8')
+            hour_bins = minute_bins // 60
+            if hour_bins.size:
+                first_hour = hour_bins.min()
+                hourly_counts = np.bincount(hour_bins - first_hour)
+                peak_hour = self._bin_starts([first_hour + hourly_counts.argmax()], 60)[0]
+            else:
+                peak_hour = None
         
         # Transaction analysis
         transaction_errors = error_df[error_df['transaction_id'].notna()]
-        transaction_counts = transaction_errors['transaction_id'].value_counts().head(10)
         
         patterns = []
         
         # Identify cascading failures (same transaction ID with multiple errors)
-        if not transaction_counts.empty:
-            for txn_id, count in transaction_counts.items():
+        if transaction_counts:
+            for txn_id, count in list(transaction_counts.items())[:10]:
                 if count > 1:
                     txn_errors = transaction_errors[transaction_errors['transaction_id'] == txn_id]
                     patterns.append({
@@ -210,9 +580,11 @@ class DataAnalyzer:
                     })
         
         # Identify error bursts (>5 errors in 1 minute)
-        df_with_minute = error_df.copy()
-        df_with_minute['minute_bin'] = df_with_minute['timestamp'].dt.floor('1T')
-        minute_counts = df_with_minute.groupby('minute_bin')['has_error'].count()
+        if minute_groups is not None:
+            minute_counts = error_minutes
+        else:
+            minutes, counts = np.unique(minute_bins, return_counts=True)
+            minute_counts = pd.Series(counts, index=self._bin_starts(minutes, 1))
         
         for minute, count in minute_counts[minute_counts > 5].items():
             patterns.append({
@@ -226,11 +598,12 @@ class DataAnalyzer:
             'total_errors': len(error_df),
             'total_log_entries': len(df),
             'error_rate': len(error_df) / len(df) if len(df) > 0 else 0,
-            'error_categories': dict(category_counts),
+            'error_categories': category_counts.to_dict(),
+            'error_categories_counter': Counter(category_counts.to_dict()),
             'error_levels': level_counts,
             'top_error_files': file_counts,
             'peak_hour': peak_hour.strftime('%H:%M') if peak_hour else None,
-            'unique_transactions_with_errors': transaction_errors['transaction_id'].nunique() if not transaction_errors.empty else 0,
+            'unique_transactions_with_errors': len(transaction_counts),
             'patterns': patterns,
             'total_warnings': total_warnings,
             'total_errors_strict': total_errors_strict
@@ -251,29 +624,61 @@ class DataAnalyzer:
             return pd.DataFrame()
         
         # Create time bins
-        df['time_bin'] = df['timestamp'].dt.floor(f'{interval_minutes}T')
+        time_bins = self._time_bins(df['timestamp'], interval_minutes)
         
-        timeline = df.groupby('time_bin').agg({
+        timeline = df.groupby(time_bins, observed=True).agg({
             'has_error': ['count', 'sum'],
-            'log_level': lambda x: x.value_counts().to_dict(),
+            'log_level': lambda x: {k: v for k, v in x.value_counts().items() if v > 0},
             'error_categories': lambda x: [cat for sublist in x for cat in sublist if sublist],
         }).reset_index()
         
         # Flatten column names
         timeline.columns = ['time_bin', 'total_logs', 'total_errors', 'level_distribution', 'error_categories']
+        timeline['time_bin'] = self._bin_starts(timeline['time_bin'], interval_minutes)
         
         # Calculate error categories distribution
         timeline['category_counts'] = timeline['error_categories'].apply(lambda x: dict(Counter(x)) if x else {})
+        timeline['error_rate'] = self._error_rates(timeline['total_errors'], timeline['total_logs'])
+        
+        return timeline
+    
+    def generate_timeline_from_groups(self, minute_groups: pd.DataFrame, interval_minutes: int = 15) -> pd.DataFrame:
+        """
+        Generate a timeline of events for visualization from per-minute aggregates.
+        
+        Args:
+            minute_groups (pd.DataFrame): Output of group_by_minute
+            interval_minutes (int): Timeline interval in minutes
+            
+        Returns:
+            pd.DataFrame: Timeline data
+        """
+        if minute_groups.empty:
+            return pd.DataFrame()
+        
+        merged = self._merge_minute_groups(minute_groups, interval_minutes)
+        category_counts = self._count_dicts(merged, 'category:')
+        
+        timeline = pd.DataFrame({
+            'total_logs': merged['total_logs'],
+            'total_errors': merged['total_errors'],
+            'level_distribution': self._count_dicts(merged, 'level:'),
+            'error_categories': [list(Counter(counts).elements()) for counts in category_counts],
+            'category_counts': category_counts
+        }, index=merged.index).reset_index()
+        
+        timeline['error_rate'] = self._error_rates(timeline['total_errors'], timeline['total_logs'])
         
         return timeline
     
-    def create_summary_stats(self, df: pd.DataFrame, analysis: Dict) -> Dict:
+    def create_summary_stats(self, df: pd.DataFrame, analysis: Dict, peak_periods: Optional[List[Dict]] = None) -> Dict:
         """
         Create comprehensive summary statistics.
         
         Args:
             df (pd.DataFrame): Input DataFrame
             analysis (dict): Analysis results from analyze_error_patterns
+            peak_periods (list): Peak periods already computed for df (optional)
             
         Returns:
             dict: Summary statistics
@@ -291,21 +696,18 @@ class DataAnalyzer:
                 'total_errors_inclusive': 0
             }
         
-        error_df = df[df['has_error'] == True]
-        
         # Time-based stats
         first_log = df['timestamp'].min()
         last_log = df['timestamp'].max()
         duration = last_log - first_log
         
-        # Top error categories
-        top_categories = []
-        if analysis['error_categories']:
-            for cat, count in sorted(analysis['error_categories'].items(), key=lambda x: x[1], reverse=True)[:5]:
-                top_categories.append(f"{cat}: {count}")
+        # Top error categories (most_common picks them with a heap)
+        category_counter = analysis.get('error_categories_counter') or Counter(analysis['error_categories'])
+        top_categories = [f"{cat}: {count}" for cat, count in category_counter.most_common(5)]
         
         # Critical periods
-        peak_periods = self.identify_peak_periods(df)
+        if peak_periods is None:
+            peak_periods = self.identify_peak_periods(df)
         
         analysis_timeframe = (
             f"{self.start_time.strftime('%Y-%m-%d %H:%M')} - {self.end_time.strftime('%H:%M')}"
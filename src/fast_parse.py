@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Fast Parse Module
+Numba-compiled kernels for the hottest per-line parsing steps.
+"""
+
+import logging
+
+try:
+    import numba  # Optional: JIT compilation of the parsing kernels
+except ImportError:
+    numba = None
+
+logger = logging.getLogger(__name__)
+
+NUMBA_AVAILABLE = numba is not None
+
+# Returned by parse_iso_prefix when the line does not start with a valid ISO timestamp
+NO_MATCH = (-1, 0, 0, 0, 0, 0, 0)
+
+
+def _is_digit(c):
+    return 48 <= c <= 57
+
+
+def _is_space(c):
+    # ASCII characters that str.strip() removes
+    return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+
+def _two_digits(line, i):
+    return (line[i] - 48) * 10 + (line[i + 1] - 48)
+
+
+def _parse_iso_prefix(line):
+    """
+    Parse an ISO 8601 timestamp at the start of a raw log line.
+
+    Mirrors the first LogParser timestamp pattern for the common case where the
+    timestamp leads the line: leading whitespace is skipped, fractional seconds
+    and the timezone designator are consumed but ignored, and field ranges are
+    validated like datetime.strptime would.
+
+    Args:
+        line (bytes): Raw log line
+
+    Returns:
+        tuple: (end offset, year, month, day, hour, minute, second); the end
+            offset is -1 when the line doesn't start with a valid timestamp
+    """
+    n = len(line)
+    i = 0
+    while i < n and _is_space(line[i]):
+        i += 1
+
+    if n - i < 19:
+        return NO_MATCH
+
+    # YYYY-MM-DD[T ]HH:MM:SS
+    for k in (0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18):
+        if not _is_digit(line[i + k]):
+            return NO_MATCH
+    sep = line[i + 10]
+    if (line[i + 4] != 45 or line[i + 7] != 45 or line[i + 13] != 58 or line[i + 16] != 58
+            or not (sep == 32 or sep == 84)):
+        return NO_MATCH
+
+    year = _two_digits(line, i) * 100 + _two_digits(line, i + 2)
+    month = _two_digits(line, i + 5)
+    day = _two_digits(line, i + 8)
+    hour = _two_digits(line, i + 11)
+    minute = _two_digits(line, i + 14)
+    second = _two_digits(line, i + 17)
+
+    if year < 1 or month < 1 or month > 12 or hour > 23 or minute > 59 or second > 59:
+        return NO_MATCH
+
+    if month == 2:
+        leap = (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+        days_in_month = 29 if leap else 28
+    elif month == 4 or month == 6 or month == 9 or month == 11:
+        days_in_month = 30
+    else:
+        days_in_month = 31
+    if day < 1 or day > days_in_month:
+        return NO_MATCH
+
+    end = i + 19
+
+    # Optional milliseconds: .123
+    if end + 4 <= n and line[end] == 46 and _is_digit(line[end + 1]) \
+            and _is_digit(line[end + 2]) and _is_digit(line[end + 3]):
+        end += 4
+
+    # Optional timezone: Z, +hh:mm or +hhmm
+    if end < n:
+        c = line[end]
+        if c == 90 or c == 122:
+            end += 1
+        elif (c == 43 or c == 45) and end + 3 <= n and _is_digit(line[end + 1]) and _is_digit(line[end + 2]):
+            if end + 6 <= n and line[end + 3] == 58 and _is_digit(line[end + 4]) and _is_digit(line[end + 5]):
+                end += 6
+            elif end + 5 <= n and _is_digit(line[end + 3]) and _is_digit(line[end + 4]):
+                end += 5
+
+    return (end, year, month, day, hour, minute, second)
+
+
+if NUMBA_AVAILABLE:
+    _is_digit = numba.njit(cache=True, nogil=True)(_is_digit)
+    _is_space = numba.njit(cache=True, nogil=True)(_is_space)
+    _two_digits = numba.njit(cache=True, nogil=True)(_two_digits)
+    parse_iso_prefix = numba.njit(cache=True, nogil=True)(_parse_iso_prefix)
+else:
+    parse_iso_prefix = None
@@ -5,35 +5,305 @@ Creates comprehensive reports, CSV exports, and visualizations.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import os
+import functools
+import concurrent.futures
+import multiprocessing
 from datetime import datetime
 from typing import Dict, List, Optional
 import logging
 
+try:
+    import pyarrow as pa  # Optional: native CSV writer for large exports
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    import kaleido  # Optional: renders the PNG charts from Plotly figures
+except ImportError:
+    kaleido = None
+
+from log_parser import usable_cpu_count
+
 logger = logging.getLogger(__name__)
 
+# The detailed CSV export converts and writes this many rows at a time
+EXPORT_CHUNK_ROWS = 50_000
+
+# Write buffer for the pandas CSV export and the executive summary
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# The log levels pie chart is only drawn for 2 to this many levels
+MAX_PIE_SLICES = 6
+
+# Slice colours of the log levels pie chart (matplotlib and Plotly), one for each
+# of up to MAX_PIE_SLICES levels
+PIE_COLORS = ['red', 'orange', 'yellow', 'green', 'blue', 'purple']
+
+# Reports name the same few log files over and over (CSV rows, summary, dashboard)
+_basename = functools.lru_cache(maxsize=4096)(os.path.basename)
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """
+    Import and style matplotlib on first use.
+    
+    matplotlib and seaborn take most of a second to import, which runs that
+    don't render PNG charts with matplotlib never pay. The style sheet and
+    palette mutate global rcParams, so they are applied once per process
+    rather than per ReportGenerator.
+    
+    Returns:
+        module: matplotlib.pyplot, set up for the Agg backend
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Charts are only ever saved to files; skip interactive backend setup
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Set matplotlib style
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    return plt
+
+@functools.lru_cache(maxsize=None)
+def _chart_mp_context():
+    """
+    Multiprocessing context for the chart worker processes.
+    
+    Charts are rendered while other threads are still running (the report
+    writers on main.py's I/O pool, the logging listener), and forking a
+    multi-threaded process can deadlock the child. The workers are forked from
+    a fork server instead: a fresh single-threaded process that imports
+    matplotlib and seaborn once for all of them. Platforms without fork
+    (Windows) use spawn.
+    
+    Returns:
+        multiprocessing.context.BaseContext: Context for ProcessPoolExecutor
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__, 'matplotlib.pyplot', 'seaborn'])
+    return context
+
+
+def _render_categories_chart(categories: List[str], counts: List[int], chart_path: str, dpi: int) -> str:
+    """
+    Render the error categories bar chart to a PNG file.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor.
+    
+    Args:
+        categories (list): Category names
+        counts (list): Number of errors per category
+        chart_path (str): Destination path
+        dpi (int): Chart resolution
+        
+    Returns:
+        str: Path to the saved chart
+    """
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(12, 6))
+    
+    bars = ax.bar(categories, counts, color='red', alpha=0.7)
+    ax.set_title('Error Categories Distribution', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Error Category')
+    ax.set_ylabel('Number of Errors')
+    ax.tick_params(axis='x', rotation=45)
+    
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+               f'{int(height)}', ha='center', va='bottom')
+    
+    plt.tight_layout()
+    
+    fig.savefig(chart_path, dpi=dpi)
+    plt.close(fig)
+    return chart_path
+
+
+def _render_timeline_chart(time_bins, total_logs, total_errors, timeline_path: str, dpi: int) -> str:
+    """
+    Render the log volume and error timeline chart to a PNG file.
+    
+    Args:
+        time_bins (np.ndarray): Start time of each bin
+        total_logs (np.ndarray): Log entries per bin
+        total_errors (np.ndarray): Errors per bin
+        timeline_path (str): Destination path
+        dpi (int): Chart resolution
+        
+    Returns:
+        str: Path to the saved chart
+    """
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    
+    # Total logs over time
+    ax1.plot(time_bins, total_logs, 
+            marker='o', linestyle='-', linewidth=2, label='Total Logs')
+    ax1.set_title('Log Volume Timeline', fontsize=14, fontweight='bold')
+    ax1.set_ylabel('Number of Log Entries')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # Errors over time
+    ax2.plot(time_bins, total_errors, 
+            marker='o', linestyle='-', linewidth=2, color='red', label='Errors')
+    ax2.set_title('Error Timeline', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Time')
+    ax2.set_ylabel('Number of Errors')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    
+    # Format x-axis
+    for ax in [ax1, ax2]:
+        ax.tick_params(axis='x', rotation=45)
+    
+    plt.tight_layout()
+    
+    fig.savefig(timeline_path, dpi=dpi)
+    plt.close(fig)
+    return timeline_path
+
+
+def _render_levels_pie_chart(levels: List[str], counts: List[int], pie_path: str, dpi: int) -> str:
+    """
+    Render the error distribution by log level pie chart to a PNG file.
+    
+    Args:
+        levels (list): Log level names
+        counts (list): Number of errors per level
+        pie_path (str): Destination path
+        dpi (int): Chart resolution
+        
+    Returns:
+        str: Path to the saved chart
+    """
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(8, 8))
+    
+    wedges, texts, autotexts = ax.pie(counts, labels=levels, autopct='%1.1f%%', 
+                                    colors=PIE_COLORS[:len(levels)], startangle=90)
+    
+    ax.set_title('Error Distribution by Log Level', fontsize=14, fontweight='bold')
+    
+    plt.tight_layout()
+    
+    fig.savefig(pie_path, dpi=dpi)
+    plt.close(fig)
+    return pie_path
+
+
+# Plotly traces shared by the dashboard and the Plotly-rendered PNG charts. Plotly
+# is imported where it is used, so CSV/Parquet-only callers never load it.
+
+def _categories_trace(categories, counts):
+    import plotly.graph_objects as go
+    return go.Bar(x=categories, y=counts, name="Error Categories",
+                  marker_color='red', opacity=0.7)
+
+
+def _log_volume_trace(time_bins, total_logs):
+    import plotly.graph_objects as go
+    return go.Scatter(x=time_bins, y=total_logs,
+                      mode='lines+markers', name='Total Logs')
+
+
+def _error_volume_trace(time_bins, total_errors):
+    import plotly.graph_objects as go
+    return go.Scatter(x=time_bins, y=total_errors,
+                      mode='lines+markers', name='Errors', line=dict(color='red'))
+
+
+def _levels_trace(levels, counts):
+    import plotly.graph_objects as go
+    return go.Pie(labels=levels, values=counts, name="Log Levels")
+
+
+def _categories_figure(categories, counts):
+    """Build the error categories bar chart as a Plotly figure."""
+    import plotly.graph_objects as go
+    fig = go.Figure(_categories_trace(categories, counts))
+    fig.update_traces(text=counts, textposition='outside')
+    fig.update_layout(title_text='Error Categories Distribution',
+                      xaxis_title='Error Category', yaxis_title='Number of Errors')
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+
+def _timeline_figure(time_bins, total_logs, total_errors):
+    """Build the log volume and error timeline chart as a Plotly figure."""
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(rows=2, cols=1, subplot_titles=('Log Volume Timeline', 'Error Timeline'))
+    fig.add_trace(_log_volume_trace(time_bins, total_logs), row=1, col=1)
+    fig.add_trace(_error_volume_trace(time_bins, total_errors), row=2, col=1)
+    fig.update_yaxes(title_text='Number of Log Entries', row=1, col=1)
+    fig.update_yaxes(title_text='Number of Errors', row=2, col=1)
+    fig.update_xaxes(title_text='Time', row=2, col=1)
+    fig.update_xaxes(tickangle=45)
+    return fig
+
+
+def _levels_pie_figure(levels, counts):
+    """Build the error distribution by log level pie chart as a Plotly figure."""
+    import plotly.graph_objects as go
+    fig = go.Figure(_levels_trace(levels, counts))
+    fig.update_traces(marker_colors=PIE_COLORS[:len(levels)],
+                      textinfo='label+percent', sort=False, rotation=90)
+    fig.update_layout(title_text='Error Distribution by Log Level')
+    return fig
+
+
+# Chart kind -> (matplotlib renderer, Plotly figure builder, (width, height) in pixels at 100 dpi)
+_CHARTS = {
+    'categories': (_render_categories_chart, _categories_figure, (1200, 600)),
+    'timeline': (_render_timeline_chart, _timeline_figure, (1400, 1000)),
+    'levels': (_render_levels_pie_chart, _levels_pie_figure, (800, 800)),
+}
+
+
 class ReportGenerator:
     """Handles generation of reports, exports, and visualizations."""
     
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, use_arrow_csv: bool = True, chart_dpi: int = 150,
+                 include_plotlyjs='cdn', chart_workers: int = 1, chart_engine: str = 'matplotlib'):
         """
         Initialize report generator with output directory.
         
         Args:
             output_dir (str): Directory to save generated reports
+            use_arrow_csv (bool): Write CSV exports with PyArrow when it is installed
+            chart_dpi (int): Resolution of the PNG charts; rasterizing cost grows
+                with the square of it
+            include_plotlyjs (str or bool): How the dashboard loads plotly.js: 'cdn' links
+                it (small file, needs network access to view), True embeds the ~4 MB bundle
+            chart_workers (int): Processes used to render the PNG charts side by side
+                (capped at the usable CPU count); 1 renders them in this process.
+                Starting the workers costs about as much as rendering the three
+                charts, so more only pays off with several idle cores
+            chart_engine (str): 'matplotlib', or 'plotly' to render the PNG charts from
+                Plotly figures in one Kaleido session (needs kaleido and a Chrome install)
         """
         self.output_dir = output_dir
+        self.use_arrow_csv = use_arrow_csv and pa is not None
+        self.chart_dpi = chart_dpi
+        self.include_plotlyjs = include_plotlyjs
+        self.chart_workers = chart_workers
+        self.chart_engine = chart_engine
+        if chart_engine == 'plotly' and kaleido is None:
+            logger.warning("kaleido is not installed; rendering PNG charts with matplotlib")
+            self.chart_engine = 'matplotlib'
         os.makedirs(output_dir, exist_ok=True)
         
-        # Set matplotlib style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
-        
     def export_detailed_csv(self, df: pd.DataFrame, filename: str = None) -> str:
         """
         Export detailed log data to CSV.
@@ -51,40 +321,246 @@ class ReportGenerator:
         
         filepath = os.path.join(self.output_dir, filename)
         
-        # Prepare DataFrame for export
-        export_df = df.copy()
+        # Save to CSV, one slice at a time so only a slice is ever copied
+        if self.use_arrow_csv:
+            try:
+                self._write_csv_arrow(self._iter_export_chunks(df), filepath)
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                logger.warning(f"PyArrow CSV export failed, falling back to pandas: {e}")
+                self._write_csv_pandas(self._iter_export_chunks(df), filepath)
+        else:
+            self._write_csv_pandas(self._iter_export_chunks(df), filepath)
+        logger.info(f"Detailed CSV exported to: {filepath}")
         
-        # Convert lists to strings for CSV compatibility
-        if 'error_categories' in export_df.columns:
-            export_df['error_categories'] = export_df['error_categories'].apply(
-                lambda x: ', '.join(x) if isinstance(x, list) and x else ''
-            )
+        return filepath
+    
+    def _iter_export_chunks(self, df: pd.DataFrame):
+        """
+        Yield the export layout of df in slices of EXPORT_CHUNK_ROWS rows.
+        
+        At least one slice is yielded, so an empty frame still gets a header.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with log data
+            
+        Yields:
+            pd.DataFrame: Export-ready slice
+        """
+        for start in range(0, max(len(df), 1), EXPORT_CHUNK_ROWS):
+            yield self._prepare_export_chunk(df.iloc[start:start + EXPORT_CHUNK_ROWS])
+    
+    def _prepare_export_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert a slice of log data to the detailed CSV layout.
+        
+        Args:
+            chunk (pd.DataFrame): Rows of the DataFrame with log data
+            
+        Returns:
+            pd.DataFrame: New DataFrame with string columns and derived columns added
+        """
+        # Unchanged columns are passed through by reference; only the
+        # converted and derived columns are new data
+        columns = dict(chunk.items())
+        
+        # Convert lists to strings for CSV compatibility (missing values become '');
+        # the per-category flag columns give the same text without touching the lists
+        if 'error_categories' in columns:
+            flag_columns = [name for name in columns if name.startswith('is_') and name.endswith('_errors')]
+            if flag_columns:
+                columns['error_categories'] = self._join_category_flags(chunk, flag_columns)
+            else:
+                columns['error_categories'] = chunk['error_categories'].str.join(', ').fillna('')
         
         # Format timestamp
-        if 'timestamp' in export_df.columns:
-            export_df['timestamp'] = export_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+        if 'timestamp' in columns:
+            columns['timestamp'] = self._format_timestamps(chunk['timestamp'])
         
         # Add derived columns
-        export_df['has_any_error'] = export_df['has_error']
-        export_df['file_name'] = export_df['file_path'].apply(lambda x: os.path.basename(x) if x else '')
+        columns['has_any_error'] = chunk['has_error']
+        columns['file_name'] = self._file_names(chunk['file_path'])
+        
+        return pd.DataFrame({name: columns[name] for name in self._export_column_order(columns)},
+                            index=chunk.index, copy=False)
+    
+    def _join_category_flags(self, chunk: pd.DataFrame, flag_columns: List[str]) -> pd.Series:
+        """
+        Rebuild the comma-separated error category text from is_<category> flags.
+        
+        Each row's flags are packed into one integer, so the text is joined
+        once per distinct combination instead of once per row.
+        
+        Args:
+            chunk (pd.DataFrame): Rows of the DataFrame with log data
+            flag_columns (list): Boolean flag columns, in classification order
+            
+        Returns:
+            pd.Series: Category text per row ('' for rows without categories)
+        """
+        names = [name[len('is_'):] for name in flag_columns]
+        flags = chunk[flag_columns].to_numpy(dtype=bool, na_value=False)
+        packed = flags @ (np.int64(1) << np.arange(len(names), dtype=np.int64))
+        combinations, codes = np.unique(packed, return_inverse=True)
+        labels = np.array([', '.join(name for bit, name in enumerate(names) if combination >> bit & 1)
+                           for combination in combinations.tolist()], dtype=object)
+        return pd.Series(labels[codes], index=chunk.index)
+    
+    def _export_column_order(self, columns) -> List[str]:
+        """
+        Order export columns for readability.
         
+        Args:
+            columns (iterable): Column names of the export DataFrame
+            
+        Returns:
+            list: Known columns first in a fixed order, then the rest as given
+        """
         # Reorder columns for better readability
         column_order = ['timestamp', 'log_level', 'has_any_error', 'is_error_strict', 'is_warning', 'error_categories', 
                        'transaction_id', 'message', 'file_name', 'file_path', 'line_number']
         
-        # Only include columns that exist
-        available_columns = [col for col in column_order if col in export_df.columns]
-        remaining_columns = [col for col in export_df.columns if col not in available_columns]
-        final_columns = available_columns + remaining_columns
+        # Only include columns that exist (set lookups keep this linear for wide frames)
+        columns = list(columns)
+        present = set(columns)
+        available_columns = [col for col in column_order if col in present]
+        placed = set(available_columns)
+        remaining_columns = [col for col in columns if col not in placed]
+        return available_columns + remaining_columns
+    
+    def export_detailed_parquet(self, df: pd.DataFrame, filename: str = None) -> Optional[str]:
+        """
+        Export detailed log data to Parquet (zstd) with native column types.
         
-        export_df = export_df[final_columns]
+        The CSV export is meant for people; this copy is for tools that load
+        the data again, and is much smaller and faster to read than the CSV.
+        Timestamps, category lists and categoricals keep their types.
         
-        # Save to CSV
-        export_df.to_csv(filepath, index=False, encoding='utf-8')
-        logger.info(f"Detailed CSV exported to: {filepath}")
+        Args:
+            df (pd.DataFrame): DataFrame with log data
+            filename (str): Custom filename (optional)
+            
+        Returns:
+            str or None: Path to saved Parquet file, or None if it couldn't be written
+        """
+        if pa is None:
+            logger.warning("PyArrow is not installed, skipping Parquet export")
+            return None
+        
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"detailed_log_analysis_{timestamp}.parquet"
+        
+        filepath = os.path.join(self.output_dir, filename)
+        
+        # Shallow copy: only the two derived columns are new data
+        export_df = df.copy(deep=False)
+        export_df['has_any_error'] = export_df['has_error']
+        export_df['file_name'] = self._file_names(export_df['file_path'])
+        
+        try:
+            table = pa.Table.from_pandas(export_df, preserve_index=False)
+            pq.write_table(table.select(self._export_column_order(table.column_names)), filepath,
+                           compression='zstd')
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.warning(f"Parquet export failed: {e}")
+            return None
+        logger.info(f"Detailed Parquet exported to: {filepath}")
         
         return filepath
     
+    def _write_csv_pandas(self, chunks, filepath: str):
+        """
+        Write DataFrame slices to one CSV file with DataFrame.to_csv.
+        
+        The file is written through a large binary buffer, and categorical
+        columns are handed over as plain values, which to_csv formats much
+        faster than it looks categories up.
+        
+        Args:
+            chunks (iterable): DataFrames with identical columns
+            filepath (str): Destination path
+        """
+        with open(filepath, 'wb', buffering=CSV_BUFFER_SIZE) as file:
+            for i, chunk in enumerate(chunks):
+                chunk = pd.DataFrame({name: column.astype(object)
+                                      if isinstance(column.dtype, pd.CategoricalDtype) else column
+                                      for name, column in chunk.items()}, copy=False)
+                chunk.to_csv(file, index=False, header=(i == 0), encoding='utf-8')
+    
+    def _format_timestamps(self, timestamps: pd.Series) -> np.ndarray:
+        """
+        Format timestamps as YYYY-MM-DD HH:MM:SS strings.
+        
+        Log lines repeat the same second many times over, so timestamps are
+        floored to the second and strftime only runs on the distinct values.
+        
+        Args:
+            timestamps (pd.Series): datetime64 timestamps
+            
+        Returns:
+            np.ndarray: Formatted string per row, NaN for NaT
+        """
+        codes, seconds = pd.factorize(timestamps.dt.floor('s'))
+        # The trailing NaN is picked up by the -1 code factorize gives NaT
+        labels = np.append(pd.DatetimeIndex(seconds).strftime('%Y-%m-%d %H:%M:%S').to_numpy(dtype=object), np.nan)
+        return labels[codes]
+    
+    def _file_names(self, file_paths: pd.Series) -> np.ndarray:
+        """
+        Map file paths to their base names.
+        
+        A log export has millions of rows but only as many distinct paths as
+        files, so basename runs once per distinct path and the results are
+        gathered back by code.
+        
+        Args:
+            file_paths (pd.Series): File paths (object or categorical)
+            
+        Returns:
+            np.ndarray: Base name per row, '' for empty or missing paths
+        """
+        codes, paths = pd.factorize(file_paths)
+        # The trailing '' is picked up by the -1 code factorize gives missing values
+        names = np.array([_basename(path) if path else '' for path in paths] + [''], dtype=object)
+        return names[codes]
+    
+    def _write_csv_arrow(self, chunks, filepath: str):
+        """
+        Write DataFrame slices to one CSV file with PyArrow's native writer.
+        
+        Booleans are rendered as True/False and categoricals as their values,
+        so the file reads back the same as one written by DataFrame.to_csv.
+        All-null columns are typed as strings, so every slice has the same schema.
+        
+        Args:
+            chunks (iterable): DataFrames with identical columns
+            filepath (str): Destination path
+        """
+        writer = schema = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                
+                columns = []
+                for column in table.columns:
+                    if pa.types.is_boolean(column.type):
+                        column = pc.if_else(column, 'True', 'False')
+                    elif pa.types.is_dictionary(column.type):
+                        column = column.cast(column.type.value_type)
+                    elif pa.types.is_null(column.type):
+                        column = column.cast(pa.string())
+                    columns.append(column)
+                table = pa.table(columns, names=table.column_names)
+                
+                if writer is None:
+                    schema = table.schema
+                    writer = pa_csv.CSVWriter(filepath, schema,
+                                              write_options=pa_csv.WriteOptions(quoting_style='needed'))
+                writer.write_table(table.cast(schema))
+        finally:
+            if writer is not None:
+                writer.close()
+    
     def create_executive_summary(self, summary_stats: Dict, analysis: Dict, 
                                peak_periods: List[Dict], filename: str = None) -> str:
         """
@@ -106,7 +582,7 @@ class ReportGenerator:
         filepath = os.path.join(self.output_dir, filename)
         
         # Create the summary content
-        summary_content = f"""
+        parts = [f"""
 # ROOT CAUSE ANALYSIS - EXECUTIVE SUMMARY
 Generated on: {datetime.now().strftime('%Y-%m-%d at %H:%M:%S')}
 
@@ -134,38 +610,38 @@ Errors incl. warnings: {summary_stats.get('total_errors_inclusive', summary_stat
 
 ## TOP ERROR CATEGORIES
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+"""]
         
         # Add top error categories
         if summary_stats.get('top_error_categories'):
             for i, category in enumerate(summary_stats['top_error_categories'], 1):
-                summary_content += f"{i}. {category}\n"
+                parts.append(f"{i}. {category}\n")
         else:
-            summary_content += "No error categories identified.\n"
+            parts.append("No error categories identified.\n")
         
         # Add peak periods section
-        summary_content += f"""
+        parts.append(f"""
 ## CRITICAL TIME PERIODS
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+""")
         
         if peak_periods:
             for i, period in enumerate(peak_periods[:5], 1):
-                summary_content += f"""
+                parts.append(f"""
 {i}. TIME: {period['time_period']}
    Errors: {period['error_count']} errors
    Files: {period['affected_files']} affected files
    Transactions: {period.get('unique_transactions', 0)} unique transactions
    Top Categories: {', '.join([f"{k}({v})" for k,v in period.get('top_error_categories', {}).items()][:3])}
-"""
+""")
         else:
-            summary_content += "No significant peak periods identified.\n"
+            parts.append("No significant peak periods identified.\n")
         
         # Add patterns section
-        summary_content += f"""
+        parts.append(f"""
 ## ERROR PATTERNS DETECTED
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+""")
         
         patterns = analysis.get('patterns', [])
         if patterns:
@@ -173,70 +649,73 @@ Errors incl. warnings: {summary_stats.get('total_errors_inclusive', summary_stat
             bursts = [p for p in patterns if p['type'] == 'error_burst']
             
             if cascading:
-                summary_content += f"\n🔗 CASCADING FAILURES ({len(cascading)} detected):\n"
+                parts.append(f"\n🔗 CASCADING FAILURES ({len(cascading)} detected):\n")
                 for pattern in cascading[:5]:
-                    summary_content += f"   • Transaction {pattern['transaction_id']}: {pattern['error_count']} errors\n"
-                    summary_content += f"     Time: {pattern['time_span']}\n"
-                    summary_content += f"     Categories: {', '.join(pattern['categories'])}\n\n"
+                    parts.append(f"   • Transaction {pattern['transaction_id']}: {pattern['error_count']} errors\n")
+                    parts.append(f"     Time: {pattern['time_span']}\n")
+                    parts.append(f"     Categories: {', '.join(pattern['categories'])}\n\n")
             
             if bursts:
-                summary_content += f"💥 ERROR BURSTS ({len(bursts)} detected):\n"
+                parts.append(f"💥 ERROR BURSTS ({len(bursts)} detected):\n")
                 for pattern in bursts[:5]:
-                    summary_content += f"   • {pattern['description']}\n"
+                    parts.append(f"   • {pattern['description']}\n")
                     
         else:
-            summary_content += "No specific error patterns detected.\n"
+            parts.append("No specific error patterns detected.\n")
         
         # Add transaction analysis
-        summary_content += f"""
+        parts.append(f"""
 ## TRANSACTION IMPACT
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 Unique Transactions with Errors: {summary_stats.get('unique_transactions_with_errors', 0)}
-"""
+""")
         
         # Add file-based analysis
         if analysis.get('top_error_files'):
-            summary_content += f"""
+            parts.append(f"""
 ## TOP ERROR FILES
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+""")
             for file_path, count in list(analysis['top_error_files'].items())[:10]:
-                file_name = os.path.basename(file_path)
-                summary_content += f"{count:3d} errors - {file_name}\n"
+                file_name = _basename(file_path)
+                parts.append(f"{count:3d} errors - {file_name}\n")
         
         # Add recommendations
-        summary_content += f"""
+        parts.append(f"""
 ## RECOMMENDATIONS
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-"""
+""")
         
         # Generate recommendations based on findings
         recommendations = []
+        category_counts = analysis.get('error_categories', {})
+        error_bursts = summary_stats.get('error_bursts', 0)
+        cascading_failures = summary_stats.get('cascading_failures', 0)
         
-        if analysis.get('error_categories', {}).get('credit_card_errors', 0) > 0:
+        if category_counts.get('credit_card_errors', 0) > 0:
             recommendations.append("1. PAYMENT PROCESSING: Review payment gateway configuration and timeout settings")
         
-        if analysis.get('error_categories', {}).get('database_errors', 0) > 0:
+        if category_counts.get('database_errors', 0) > 0:
             recommendations.append("2. DATABASE: Investigate database connection pool and timeout configurations")
         
-        if analysis.get('error_categories', {}).get('server_errors', 0) > 0:
+        if category_counts.get('server_errors', 0) > 0:
             recommendations.append("3. SERVER INFRASTRUCTURE: Review server capacity and load balancing")
         
-        if summary_stats.get('error_bursts', 0) > 0:
+        if error_bursts > 0:
             recommendations.append("4. MONITORING: Implement real-time alerting for error burst detection")
         
-        if summary_stats.get('cascading_failures', 0) > 0:
+        if cascading_failures > 0:
             recommendations.append("5. RESILIENCE: Review circuit breaker patterns and failure isolation")
         
         if not recommendations:
             recommendations.append("1. Continue monitoring for similar patterns in future incidents")
         
         for rec in recommendations:
-            summary_content += f"{rec}\n"
+            parts.append(f"{rec}\n")
         
-        summary_content += f"""
+        parts.append(f"""
 ## NEXT STEPS
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
@@ -247,130 +726,167 @@ Unique Transactions with Errors: {summary_stats.get('unique_transactions_with_er
 
 Report generated by Log Analyzer v1.0
 For detailed data, see accompanying CSV file.
-"""
+""")
         
-        # Save to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
+        # Save to file; the parts are gathered in the write buffer and reach
+        # the file in a single write when it is closed
+        with open(filepath, 'w', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            f.writelines(parts)
         
         logger.info(f"Executive summary saved to: {filepath}")
         return filepath
     
-    def create_visualizations(self, df: pd.DataFrame, analysis: Dict, 
-                            timeline_df: pd.DataFrame) -> List[str]:
+    def build_plot_data(self, total_logs: int, analysis: Dict, timeline_df: pd.DataFrame) -> Dict:
         """
-        Create visualizations and save as PNG files.
+        Collect the aggregated series the charts and dashboard are drawn from.
         
         Args:
-            df (pd.DataFrame): Main log DataFrame
+            total_logs (int): Number of log entries analyzed
             analysis (dict): Analysis results
             timeline_df (pd.DataFrame): Timeline data
             
+        Returns:
+            dict: Plot data for create_visualizations and create_interactive_dashboard
+        """
+        return {
+            'total_logs': total_logs,
+            'timeline': timeline_df,
+            'by_category': pd.Series(analysis.get('error_categories', {}), dtype='int64')
+        }
+    
+    def create_visualizations(self, plot_data: Dict, analysis: Dict) -> List[str]:
+        """
+        Create visualizations and save as PNG files.
+        
+        Args:
+            plot_data (dict): Aggregated series to plot ('total_logs', 'timeline',
+                'by_category') so the charts never touch the row-level data
+            analysis (dict): Analysis results
+            
         Returns:
             list: List of paths to saved visualization files
         """
         saved_files = []
         
-        if df.empty:
+        if not plot_data.get('total_logs'):
             logger.warning("No data available for visualizations")
             return saved_files
         
+        timeline_df = plot_data['timeline']
+        by_category = plot_data['by_category']
+        
+        # Each chart only needs plain arrays, so the renders can run in worker processes
+        charts = []
+        
         # 1. Error Categories Bar Chart
-        if analysis.get('error_categories'):
-            fig, ax = plt.subplots(figsize=(12, 6))
-            categories = list(analysis['error_categories'].keys())
-            counts = list(analysis['error_categories'].values())
-            
-            bars = ax.bar(categories, counts, color='red', alpha=0.7)
-            ax.set_title('Error Categories Distribution', fontsize=14, fontweight='bold')
-            ax.set_xlabel('Error Category')
-            ax.set_ylabel('Number of Errors')
-            ax.tick_params(axis='x', rotation=45)
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}', ha='center', va='bottom')
-            
-            plt.tight_layout()
-            
-            chart_path = os.path.join(self.output_dir, 'error_categories_chart.png')
-            plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            saved_files.append(chart_path)
-            logger.info(f"Error categories chart saved to: {chart_path}")
+        if not by_category.empty:
+            charts.append(('Error categories chart', 'categories',
+                           (list(by_category.index), list(by_category.values)),
+                           os.path.join(self.output_dir, 'error_categories_chart.png')))
         
         # 2. Timeline Chart
         if not timeline_df.empty:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-            
-            # Total logs over time
-            ax1.plot(timeline_df['time_bin'], timeline_df['total_logs'], 
-                    marker='o', linestyle='-', linewidth=2, label='Total Logs')
-            ax1.set_title('Log Volume Timeline', fontsize=14, fontweight='bold')
-            ax1.set_ylabel('Number of Log Entries')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-            
-            # Errors over time
-            ax2.plot(timeline_df['time_bin'], timeline_df['total_errors'], 
-                    marker='o', linestyle='-', linewidth=2, color='red', label='Errors')
-            ax2.set_title('Error Timeline', fontsize=14, fontweight='bold')
-            ax2.set_xlabel('Time')
-            ax2.set_ylabel('Number of Errors')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
-            
-            # Format x-axis
-            for ax in [ax1, ax2]:
-                ax.tick_params(axis='x', rotation=45)
-            
-            plt.tight_layout()
-            
-            timeline_path = os.path.join(self.output_dir, 'timeline_chart.png')
-            plt.savefig(timeline_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            saved_files.append(timeline_path)
-            logger.info(f"Timeline chart saved to: {timeline_path}")
+            charts.append(('Timeline chart', 'timeline',
+                           (timeline_df['time_bin'].to_numpy(), timeline_df['total_logs'].to_numpy(),
+                            timeline_df['total_errors'].to_numpy()),
+                           os.path.join(self.output_dir, 'timeline_chart.png')))
+        
+        # 3. Log Levels Pie Chart (a single slice says nothing, and more than
+        # MAX_PIE_SLICES slices are unreadable, so neither is worth rendering)
+        error_levels = analysis.get('error_levels') or {}
+        if 1 < len(error_levels) <= MAX_PIE_SLICES:
+            charts.append(('Log levels pie chart', 'levels',
+                           (list(error_levels.keys()), list(error_levels.values())),
+                           os.path.join(self.output_dir, 'log_levels_pie_chart.png')))
+        elif error_levels:
+            logger.info(f"Skipping log levels pie chart ({len(error_levels)} levels)")
+        
+        paths = None
+        if self.chart_engine == 'plotly' and charts:
+            paths = self._write_plotly_charts(charts)
+        if paths is None:
+            paths = self._render_matplotlib_charts(charts)
+        
+        for (label, _, _, _), path in zip(charts, paths):
+            saved_files.append(path)
+            logger.info(f"{label} saved to: {path}")
         
-        # 3. Log Levels Pie Chart
-        if analysis.get('error_levels'):
-            fig, ax = plt.subplots(figsize=(8, 8))
-            levels = list(analysis['error_levels'].keys())
-            counts = list(analysis['error_levels'].values())
-            
-            colors = ['red', 'orange', 'yellow', 'green', 'blue']
-            wedges, texts, autotexts = ax.pie(counts, labels=levels, autopct='%1.1f%%', 
-                                            colors=colors[:len(levels)], startangle=90)
-            
-            ax.set_title('Error Distribution by Log Level', fontsize=14, fontweight='bold')
+        return saved_files
+    
+    def _render_matplotlib_charts(self, charts: List[tuple]) -> List[str]:
+        """
+        Render charts with matplotlib, in worker processes when there are cores to spare.
+        
+        Args:
+            charts (list): (label, kind, data, path) tuples from create_visualizations
             
-            pie_path = os.path.join(self.output_dir, 'log_levels_pie_chart.png')
-            plt.savefig(pie_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            saved_files.append(pie_path)
-            logger.info(f"Log levels pie chart saved to: {pie_path}")
+        Returns:
+            list: Paths to the saved charts
+        """
+        jobs = [(_CHARTS[kind][0], data + (path, self.chart_dpi)) for _, kind, data, path in charts]
         
-        return saved_files
+        workers = min(self.chart_workers, len(jobs), usable_cpu_count())
+        if workers <= 1:
+            return [render(*args) for render, args in jobs]
+        
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=_chart_mp_context()) as executor:
+            futures = [executor.submit(render, *args) for render, args in jobs]
+            return [future.result() for future in futures]
     
-    def create_interactive_dashboard(self, df: pd.DataFrame, analysis: Dict, 
-                                   timeline_df: pd.DataFrame) -> str:
+    def _write_plotly_charts(self, charts: List[tuple]) -> Optional[List[str]]:
+        """
+        Render charts from Plotly figures, all in one Kaleido session.
+        
+        Args:
+            charts (list): (label, kind, data, path) tuples from create_visualizations
+            
+        Returns:
+            list or None: Paths to the saved charts, or None if Kaleido failed
+        """
+        import plotly.io as pio
+        
+        figures = [_CHARTS[kind][1](*data) for _, kind, data, _ in charts]
+        paths = [path for _, _, _, path in charts]
+        
+        try:
+            pio.write_images(figures, paths,
+                             width=[_CHARTS[kind][2][0] for _, kind, _, _ in charts],
+                             height=[_CHARTS[kind][2][1] for _, kind, _, _ in charts],
+                             scale=self.chart_dpi / 100, validate=False)
+        except Exception as e:
+            logger.error(f"Rendering charts with Kaleido failed, falling back to matplotlib: {e}")
+            return None
+        return paths
+    
+    def create_interactive_dashboard(self, plot_data: Dict, analysis: Dict) -> str:
         """
         Create an interactive HTML dashboard using Plotly.
         
         Args:
-            df (pd.DataFrame): Main log DataFrame
+            plot_data (dict): Aggregated series to plot ('total_logs', 'timeline',
+                'by_category') so the dashboard never touches the row-level data
             analysis (dict): Analysis results
-            timeline_df (pd.DataFrame): Timeline data
             
         Returns:
             str: Path to saved HTML file
         """
-        if df.empty:
+        if not plot_data.get('total_logs'):
             logger.warning("No data available for dashboard")
             return ""
         
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
+        timeline_df = plot_data['timeline']
+        by_category = plot_data['by_category']
+        
+        # Traces get plain ndarrays, which Plotly validates and serializes in
+        # bulk rather than element by element as it does for lists and Series
+        if not timeline_df.empty:
+            time_bins = timeline_df['time_bin'].to_numpy()
+            total_logs = timeline_df['total_logs'].to_numpy()
+            total_errors = timeline_df['total_errors'].to_numpy()
+        
         # Create subplots
         fig = make_subplots(
             rows=3, cols=2,
@@ -383,42 +899,25 @@ For detailed data, see accompanying CSV file.
         )
         
         # 1. Error Categories Bar Chart
-        if analysis.get('error_categories'):
-            categories = list(analysis['error_categories'].keys())
-            counts = list(analysis['error_categories'].values())
+        if not by_category.empty:
+            categories = by_category.index.to_numpy()
+            counts = by_category.to_numpy()
             
-            fig.add_trace(
-                go.Bar(x=categories, y=counts, name="Error Categories",
-                      marker_color='red', opacity=0.7),
-                row=1, col=1
-            )
+            fig.add_trace(_categories_trace(categories, counts), row=1, col=1)
         
         # 2. & 3. Timeline Charts
         if not timeline_df.empty:
-            fig.add_trace(
-                go.Scatter(x=timeline_df['time_bin'], y=timeline_df['total_logs'],
-                          mode='lines+markers', name='Total Logs'),
-                row=1, col=2
-            )
-            
-            fig.add_trace(
-                go.Scatter(x=timeline_df['time_bin'], y=timeline_df['total_errors'],
-                          mode='lines+markers', name='Errors', line=dict(color='red')),
-                row=2, col=1
-            )
+            fig.add_trace(_log_volume_trace(time_bins, total_logs), row=1, col=2)
+            fig.add_trace(_error_volume_trace(time_bins, total_errors), row=2, col=1)
         
         # 4. Log Levels Pie Chart
         if analysis.get('error_levels'):
-            fig.add_trace(
-                go.Pie(labels=list(analysis['error_levels'].keys()),
-                      values=list(analysis['error_levels'].values()),
-                      name="Log Levels"),
-                row=2, col=2
-            )
+            fig.add_trace(_levels_trace(list(analysis['error_levels'].keys()),
+                                        list(analysis['error_levels'].values())), row=2, col=2)
         
         # 5. Top Error Files
         if analysis.get('top_error_files'):
-            files = [os.path.basename(f) for f in list(analysis['top_error_files'].keys())[:10]]
+            files = [_basename(f) for f in list(analysis['top_error_files'].keys())[:10]]
             counts = list(analysis['top_error_files'].values())[:10]
             
             fig.add_trace(
@@ -429,10 +928,14 @@ For detailed data, see accompanying CSV file.
         
         # 6. Error Rate Over Time
         if not timeline_df.empty:
-            error_rate = (timeline_df['total_errors'] / timeline_df['total_logs']) * 100
+            # Precomputed by the timeline builders; derived here for other frames
+            if 'error_rate' in timeline_df.columns:
+                error_rate = timeline_df['error_rate'].to_numpy()
+            else:
+                error_rate = total_errors / total_logs * 100
             
             fig.add_trace(
-                go.Scatter(x=timeline_df['time_bin'], y=error_rate,
+                go.Scatter(x=time_bins, y=error_rate,
                           mode='lines+markers', name='Error Rate (%)',
                           line=dict(color='darkred')),
                 row=3, col=2
@@ -450,9 +953,10 @@ For detailed data, see accompanying CSV file.
         for row, col in [(1, 2), (2, 1), (3, 2)]:
             fig.update_xaxes(tickangle=45, row=row, col=col)
         
-        # Save interactive HTML
+        # Save interactive HTML (Plotly serializes the traces with orjson when it is installed)
         dashboard_path = os.path.join(self.output_dir, 'interactive_dashboard.html')
-        fig.write_html(dashboard_path)
+        fig.write_html(dashboard_path, include_plotlyjs=self.include_plotlyjs, full_html=True,
+                       validate=False, config={'responsive': True})
         
         logger.info(f"Interactive dashboard saved to: {dashboard_path}")
         return dashboard_path
@@ -464,25 +968,28 @@ def main():
     
     # Create sample data for testing
     import pandas as pd
-    from datetime import datetime, timedelta
+    from datetime import datetime
     
-    # Generate test data
+    # Generate test data one column at a time (raise n_rows to benchmark exports)
     base_time = datetime(2023, 10, 1, 10, 0, 0)
-    sample_data = []
-    
-    for i in range(50):
-        sample_data.append({
-            'timestamp': base_time + timedelta(minutes=i*2),
-            'log_level': 'ERROR' if i % 5 == 0 else 'INFO',
-            'has_error': i % 5 == 0,
-            'error_categories': ['credit_card_errors'] if i % 5 == 0 else [],
-            'file_path': f'/test/log{i%3}.log',
-            'line_number': i + 1,
-            'message': f'Test message {i}',
-            'transaction_id': f'TXN{i}' if i % 10 == 0 else None
-        })
-    
-    df = pd.DataFrame(sample_data)
+    n_rows = 50
+    i = np.arange(n_rows)
+    is_error = i % 5 == 0
+    ids = i.astype(str).astype(object)
+    
+    category_lists = np.empty(2, dtype=object)
+    category_lists[0], category_lists[1] = ['credit_card_errors'], []
+    
+    df = pd.DataFrame({
+        'timestamp': pd.Timestamp(base_time) + pd.to_timedelta(i * 2, unit='m'),
+        'log_level': np.where(is_error, 'ERROR', 'INFO').astype(object),
+        'has_error': is_error,
+        'error_categories': category_lists[(~is_error).astype(np.intp)],
+        'file_path': np.array([f'/test/log{k}.log' for k in range(3)], dtype=object)[i % 3],
+        'line_number': i + 1,
+        'message': 'Test message ' + ids,
+        'transaction_id': np.where(i % 10 == 0, 'TXN' + ids, None)
+    })
     
     # Test report generation
     output_dir = '/tmp/log_analyzer_test'
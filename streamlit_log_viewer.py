@@ -1,10 +1,25 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from pathlib import Path
+import hashlib
 import io
+import os
+import re
+import time
+
+try:
+    import pyarrow as pa  # Optional: multi-threaded CSV parsing and native substring search
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl  # Optional: multi-threaded CSV reader for large uploads
+except ImportError:
+    pl = None
 
 # Configure Streamlit page
 st.set_page_config(
@@ -52,36 +67,228 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def load_data(uploaded_file):
-    """Load and process the CSV data"""
+def _read_csv(file_bytes):
+    """Read CSV bytes into a pandas DataFrame, using Polars' or Arrow's parallel reader when available"""
+    if pl is not None:
+        try:
+            return pl.read_csv(io.BytesIO(file_bytes), try_parse_dates=True,
+                               infer_schema_length=10000).to_pandas()
+        except Exception:
+            pass  # e.g. a column whose type changes after the inferred rows; pandas copes
+    if pa is not None:
+        try:
+            # Parse straight from the upload's buffer (no file-like copy); empty
+            # strings become NaN like in pandas, and timestamps come back as ns
+            table = pacsv.read_csv(pa.py_buffer(file_bytes),
+                                   convert_options=pacsv.ConvertOptions(strings_can_be_null=True))
+            return table.to_pandas(coerce_temporal_nanoseconds=True)
+        except Exception:
+            pass  # e.g. ragged rows; pandas is more forgiving
+    return pd.read_csv(io.BytesIO(file_bytes), low_memory=False)
+
+# Parsed uploads are kept here as Parquet, keyed by the SHA-1 of the CSV bytes,
+# so a file loaded before skips CSV parsing even in a new session
+PARQUET_CACHE_DIR = Path.home() / '.cache' / 'log_viewer'
+
+# Part of every cache file name; bump it whenever _parse_csv changes what it
+# stores (dtypes, attrs) so frames written by an older viewer are parsed again
+PARQUET_CACHE_VERSION = 2
+
+# The cached frames hold uploaded log contents, so they don't stay forever:
+# entries older than this or beyond the newest PARQUET_CACHE_MAX_FILES are deleted
+PARQUET_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+PARQUET_CACHE_MAX_FILES = 8
+
+def _parquet_cache_path(file_bytes):
+    """Cache file for an upload's parsed frame under the current cache version"""
+    return PARQUET_CACHE_DIR / f"v{PARQUET_CACHE_VERSION}-{hashlib.sha1(file_bytes).hexdigest()}.parquet"
+
+def _load_cached_parquet(cache_path):
+    """Return the DataFrame stored at cache_path, or None if it isn't usable"""
+    if not cache_path.exists():
+        return None
     try:
-        # Read CSV
-        df = pd.read_csv(uploaded_file, low_memory=False)
-        
-        # Convert timestamp to datetime, handle errors
+        df = pd.read_parquet(cache_path, engine='pyarrow')
+    except Exception:
+        return None  # Unreadable (or pyarrow missing); parse the CSV again
+    try:
+        os.utime(cache_path)  # Recently used entries are the last to be pruned
+    except OSError:
+        pass
+    return df
+
+def _save_cached_parquet(df, cache_path):
+    """Store df at cache_path; caching is best effort, so failures are ignored"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, cache_path)  # Readers never see a partial file
+    except Exception:
+        pass
+    _prune_parquet_cache()
+
+def _prune_parquet_cache():
+    """Delete cache files from other cache versions, past PARQUET_CACHE_MAX_AGE, or beyond the newest PARQUET_CACHE_MAX_FILES"""
+    prefix = f"v{PARQUET_CACHE_VERSION}-"
+    now = time.time()
+    current = []
+    try:
+        entries = list(os.scandir(PARQUET_CACHE_DIR))
+    except OSError:
+        return
+    
+    for entry in entries:
         try:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-        except Exception as e:
-            st.warning(f"Warning: Could not parse timestamps properly: {str(e)}")
+            mtime = entry.stat().st_mtime
+            if entry.name.startswith(prefix) and entry.name.endswith('.parquet') and now - mtime < PARQUET_CACHE_MAX_AGE:
+                current.append((mtime, entry.path))
+            elif entry.name.endswith('.parquet') or now - mtime >= PARQUET_CACHE_MAX_AGE:
+                os.remove(entry.path)  # Older version, expired, or a temp file left by a crash
+        except OSError:
+            pass
+    
+    current.sort(reverse=True)
+    for _, path in current[PARQUET_CACHE_MAX_FILES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+# Tokens that count as True in boolean columns (matched without building string copies)
+_TRUE_VALUES = [True, 1, '1', 'true', 'True', 'TRUE', 'yes', 'Yes', 'YES']
+
+# Uploads larger than this are read in chunks: the charts and summary statistics
+# are counted over every row, but only a random sample of rows is kept in memory
+# for filtering and the table. Kept well below Streamlit's default upload limit
+# (server.maxUploadSize, 200 MB) so the default setup can reach this path
+LARGE_UPLOAD_BYTES = 50 * 1024 * 1024
+SAMPLE_ROWS = 100_000
+CSV_CHUNK_ROWS = 1 << 18
+
+def _convert_columns(df):
+    """Parse the timestamp column and normalize the boolean flag columns in place"""
+    # Convert timestamp to datetime, handle errors
+    try:
+        df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+    except Exception as e:
+        st.warning(f"Warning: Could not parse timestamps properly: {str(e)}")
+    
+    # Convert boolean columns
+    bool_columns = ['has_any_error', 'is_error_strict', 'is_warning', 'has_error', 
+                   'is_timeout_errors', 'is_exception_errors', 'is_server_errors']
+    
+    for col in bool_columns:
+        if col in df.columns:
+            if df[col].dtype == bool:
+                continue  # read_csv already parsed a clean True/False column
+            try:
+                df[col] = df[col].isin(_TRUE_VALUES)
+            except Exception as e:
+                st.warning(f"Warning: Could not process boolean column {col}: {str(e)}")
+    return df
+
+def _error_hour_counts(df):
+    """Errors per hour as a Series indexed by hour number (hours since the epoch), omitting hours without errors"""
+    if 'timestamp' not in df.columns or 'has_error' not in df.columns:
+        return pd.Series(dtype='int64')
+    
+    # bincount over hour numbers, keeping the hours that had errors
+    is_error = (df['has_error'] == True).to_numpy()
+    error_times = df['timestamp'].to_numpy()[is_error]
+    hour_ids = error_times[~np.isnat(error_times)].astype('datetime64[h]').view('i8')
+    if not len(hour_ids):
+        return pd.Series(dtype='int64')
+    first_hour = hour_ids.min()
+    counts = np.bincount(hour_ids - first_hour)
+    hours = np.flatnonzero(counts)
+    return pd.Series(counts[hours], index=hours + first_hour)
+
+def _read_csv_sampled(file_bytes):
+    """
+    Read a large CSV chunk by chunk, keeping a uniform random sample of its rows.
+    
+    Counts for the charts and summary statistics are accumulated over every chunk
+    and stored in the sample's attrs['precomputed'] (plain lists, so they survive
+    the Parquet cache).
+    """
+    rng = np.random.default_rng(0)  # Same sample for the same file
+    level_counts = pd.Series(dtype='int64')
+    file_counts = pd.Series(dtype='int64')
+    error_hours = pd.Series(dtype='int64')
+    rows = errors = warnings = 0
+    sample, sample_keys = None, np.empty(0)
+    
+    for chunk in pd.read_csv(io.BytesIO(file_bytes), chunksize=CSV_CHUNK_ROWS, low_memory=False):
+        chunk = _convert_columns(chunk)
+        rows += len(chunk)
+        if 'has_error' in chunk.columns:
+            errors += int(chunk['has_error'].sum())
+        if 'is_warning' in chunk.columns:
+            warnings += int(chunk['is_warning'].sum())
+        if 'log_level' in chunk.columns:
+            level_counts = level_counts.add(chunk['log_level'].value_counts(), fill_value=0)
+        if 'file_name' in chunk.columns:
+            file_counts = file_counts.add(chunk['file_name'].value_counts(), fill_value=0)
+        error_hours = error_hours.add(_error_hour_counts(chunk), fill_value=0)
         
-        # Convert boolean columns
-        bool_columns = ['has_any_error', 'is_error_strict', 'is_warning', 'has_error', 
-                       'is_timeout_errors', 'is_exception_errors', 'is_server_errors']
+        # Every row gets a random key and the rows with the smallest keys are kept
+        keys = np.concatenate([sample_keys, rng.random(len(chunk))])
+        pool = chunk if sample is None else pd.concat([sample, chunk])
+        if len(pool) > SAMPLE_ROWS:
+            keep = np.sort(np.argpartition(keys, SAMPLE_ROWS)[:SAMPLE_ROWS])
+            pool, keys = pool.iloc[keep], keys[keep]
+        sample, sample_keys = pool, keys
+    
+    if sample is None:
+        # No chunk at all (header-only file): keep the columns, with no rows
+        sample = _convert_columns(pd.read_csv(io.BytesIO(file_bytes), nrows=0))
+    
+    df = sample.reset_index(drop=True)
+    df.attrs['precomputed'] = {
+        'rows': rows,
+        'errors': errors,
+        'warnings': warnings,
+        'level_counts': [[level, int(n)] for level, n in level_counts.sort_values(ascending=False).items()],
+        'file_counts': [[name, int(n)] for name, n in file_counts.sort_values(ascending=False).items()],
+        'error_hours': [[int(hour), int(n)] for hour, n in error_hours.sort_index().items()],
+    }
+    return df
+
+@st.cache_data(show_spinner=False)
+def _parse_csv(file_bytes):
+    """Parse and process the CSV data, cached by file content across reruns and sessions"""
+    cache_path = _parquet_cache_path(file_bytes)
+    df = _load_cached_parquet(cache_path)
+    if df is not None:
+        return df
+    
+    try:
+        # Read CSV
+        if len(file_bytes) > LARGE_UPLOAD_BYTES:
+            df = _read_csv_sampled(file_bytes)
+        else:
+            df = _convert_columns(_read_csv(file_bytes))
         
-        for col in bool_columns:
+        # Few distinct values repeated on every row: store them as categoricals so
+        # counting and filtering work on integer codes (value_counts then also
+        # lists unobserved categories with a count of 0)
+        for col in ('file_name', 'log_level', 'error_categories'):
             if col in df.columns:
-                try:
-                    df[col] = df[col].astype(str).str.lower().isin(['true', '1', 'yes'])
-                except Exception as e:
-                    st.warning(f"Warning: Could not process boolean column {col}: {str(e)}")
+                df[col] = df[col].astype('category')
         
+        _save_cached_parquet(df, cache_path)
         return df
     except Exception as e:
         st.error(f"Error loading CSV file: {str(e)}")
         return None
 
-def create_summary_stats(df):
-    """Create summary statistics"""
+def load_data(uploaded_file):
+    """Load and process the CSV data"""
+    return _parse_csv(uploaded_file.getvalue())
+
+def create_summary_stats(df, precomputed=None):
+    """Create summary statistics (from the whole-file counts of a sampled upload when given)"""
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
@@ -90,10 +297,13 @@ def create_summary_stats(df):
             <h3>📊 Total Entries</h3>
             <h2>{:,}</h2>
         </div>
-        """.format(len(df)), unsafe_allow_html=True)
+        """.format(precomputed['rows'] if precomputed else len(df)), unsafe_allow_html=True)
     
     with col2:
-        error_count = df['has_error'].sum() if 'has_error' in df.columns else 0
+        if precomputed:
+            error_count = precomputed['errors']
+        else:
+            error_count = df['has_error'].sum() if 'has_error' in df.columns else 0
         st.markdown("""
         <div class="stat-container">
             <h3>❌ Errors</h3>
@@ -102,7 +312,10 @@ def create_summary_stats(df):
         """.format(error_count), unsafe_allow_html=True)
     
     with col3:
-        warning_count = df['is_warning'].sum() if 'is_warning' in df.columns else 0
+        if precomputed:
+            warning_count = precomputed['warnings']
+        else:
+            warning_count = df['is_warning'].sum() if 'is_warning' in df.columns else 0
         st.markdown("""
         <div class="stat-container">
             <h3>⚠️ Warnings</h3>
@@ -111,7 +324,10 @@ def create_summary_stats(df):
         """.format(warning_count), unsafe_allow_html=True)
     
     with col4:
-        file_count = df['file_name'].nunique() if 'file_name' in df.columns else 0
+        if precomputed:
+            file_count = len(precomputed['file_counts'])
+        else:
+            file_count = df['file_name'].nunique() if 'file_name' in df.columns else 0
         st.markdown("""
         <div class="stat-container">
             <h3>📁 Files</h3>
@@ -119,8 +335,11 @@ def create_summary_stats(df):
         </div>
         """.format(file_count), unsafe_allow_html=True)
 
-def create_visualizations(df):
-    """Create visualizations"""
+def create_visualizations(df, precomputed=None):
+    """Create visualizations (from the whole-file counts of a sampled upload when given)"""
+    # Imported here so the landing page renders without loading Plotly
+    import plotly.express as px
+    
     st.subheader("📈 Data Visualizations")
     
     col1, col2 = st.columns(2)
@@ -128,7 +347,11 @@ def create_visualizations(df):
     with col1:
         if 'log_level' in df.columns:
             # Log level distribution
-            level_counts = df['log_level'].value_counts()
+            if precomputed:
+                level_counts = pd.Series(dict(precomputed['level_counts']), dtype='int64')
+            else:
+                level_counts = df['log_level'].value_counts()
+            level_counts = level_counts[level_counts > 0]
             fig_levels = px.pie(
                 values=level_counts.values, 
                 names=level_counts.index, 
@@ -145,7 +368,11 @@ def create_visualizations(df):
     with col2:
         if 'file_name' in df.columns:
             # Top files by entry count
-            top_files = df['file_name'].value_counts().head(10)
+            if precomputed:
+                top_files = pd.Series(dict(precomputed['file_counts']), dtype='int64')
+            else:
+                top_files = df['file_name'].value_counts()
+            top_files = top_files[top_files > 0].head(10)
             fig_files = px.bar(
                 x=top_files.values,
                 y=top_files.index,
@@ -160,11 +387,15 @@ def create_visualizations(df):
     if 'timestamp' in df.columns and 'has_error' in df.columns:
         st.subheader("🕒 Error Timeline")
         
-        # Group by hour and count errors
-        df_errors = df[df['has_error'] == True].copy()
-        if len(df_errors) > 0:
-            df_errors['hour'] = df_errors['timestamp'].dt.floor('h')
-            hourly_errors = df_errors.groupby('hour').size().reset_index(name='error_count')
+        if precomputed:
+            error_hours = pd.Series(dict(precomputed['error_hours']), dtype='int64')
+        else:
+            error_hours = _error_hour_counts(df)
+        if len(error_hours):
+            hourly_errors = pd.DataFrame({
+                'hour': error_hours.index.to_numpy(dtype='i8').astype('datetime64[h]').astype('datetime64[ns]'),
+                'error_count': error_hours.to_numpy()
+            })
             
             fig_timeline = px.line(
                 hourly_errors, 
@@ -176,13 +407,27 @@ def create_visualizations(df):
             fig_timeline.update_traces(line_color='#dc3545', line_width=3)
             st.plotly_chart(fig_timeline, width='stretch')
 
-def apply_filters(df):
-    """Apply filters based on sidebar inputs"""
-    filtered_df = df.copy()
+@st.cache_data(show_spinner=False)
+def _filter_options(file_id, _df):
+    """Collect the sidebar filter choices once per upload (_df is not hashed; file_id keys it)"""
+    options = {}
+    if 'file_name' in _df.columns:
+        options['files'] = sorted(_df['file_name'].dropna().unique())
+    if 'log_level' in _df.columns:
+        options['levels'] = sorted(_df['log_level'].dropna().unique())
+    if 'timestamp' in _df.columns:
+        options['min_date'] = _df['timestamp'].min().date()
+        options['max_date'] = _df['timestamp'].max().date()
+    return options
+
+def apply_filters(df, options, file_id=None):
+    """Apply filters based on sidebar inputs; returns df itself, not a copy, when no row is filtered out"""
+    # Filters narrow one row mask; the frame is only sliced once, at the end
+    mask = np.ones(len(df), dtype=bool)
     
     # File filter
     if 'file_name' in df.columns:
-        files = sorted(df['file_name'].dropna().unique())
+        files = options['files']
         selected_files = st.sidebar.multiselect(
             "📁 Filter by Files:",
             options=files,
@@ -191,11 +436,11 @@ def apply_filters(df):
         )
         
         if selected_files:
-            filtered_df = filtered_df[filtered_df['file_name'].isin(selected_files)]
+            mask &= df['file_name'].isin(selected_files).to_numpy()
     
     # Log level filter
     if 'log_level' in df.columns:
-        levels = sorted(df['log_level'].dropna().unique())
+        levels = options['levels']
         selected_levels = st.sidebar.multiselect(
             "📊 Filter by Log Level:",
             options=levels,
@@ -204,7 +449,7 @@ def apply_filters(df):
         )
         
         if selected_levels:
-            filtered_df = filtered_df[filtered_df['log_level'].isin(selected_levels)]
+            mask &= df['log_level'].isin(selected_levels).to_numpy()
     
     # Error type filter
     if 'has_error' in df.columns:
@@ -215,16 +460,16 @@ def apply_filters(df):
         )
         
         if error_filter == "Errors Only":
-            filtered_df = filtered_df[filtered_df['has_error'] == True]
+            mask &= (df['has_error'] == True).to_numpy()
         elif error_filter == "Non-Errors Only":
-            filtered_df = filtered_df[filtered_df['has_error'] == False]
+            mask &= (df['has_error'] == False).to_numpy()
     
     # Date range filter
     if 'timestamp' in df.columns:
         st.sidebar.subheader("📅 Date Range Filter")
         
-        min_date = df['timestamp'].min().date()
-        max_date = df['timestamp'].max().date()
+        min_date = options['min_date']
+        max_date = options['max_date']
         
         start_date = st.sidebar.date_input(
             "Start Date:",
@@ -244,10 +489,8 @@ def apply_filters(df):
             start_datetime = pd.Timestamp(start_date)
             end_datetime = pd.Timestamp(end_date) + pd.Timedelta(days=1)
             
-            filtered_df = filtered_df[
-                (filtered_df['timestamp'] >= start_datetime) & 
-                (filtered_df['timestamp'] < end_datetime)
-            ]
+            mask &= ((df['timestamp'] >= start_datetime) & 
+                     (df['timestamp'] < end_datetime)).to_numpy()
     
     # Search filter
     search_term = st.sidebar.text_input(
@@ -256,22 +499,83 @@ def apply_filters(df):
     )
     
     if search_term and 'message' in df.columns:
-        filtered_df = filtered_df[
-            filtered_df['message'].str.contains(search_term, case=False, na=False)
-        ]
-    
-    return filtered_df
-
-def style_dataframe(df):
-    """Apply styling to the dataframe"""
-    def highlight_errors(row):
-        if 'has_error' in row and row['has_error']:
-            return ['background-color: #fee'] * len(row)
-        elif 'is_warning' in row and row['is_warning']:
-            return ['background-color: #fff3cd'] * len(row)
+        if file_id is not None and _WORD_TERM.fullmatch(search_term):
+            # A single word: look the matching rows up instead of scanning every message
+            rows = _indexed_matches(_message_index(file_id, df['message']), search_term)
+            mask &= df.index.isin(rows)
         else:
-            return [''] * len(row)
+            # Only scan the messages of rows the other filters kept
+            mask[mask] = _message_matches(df['message'][mask], search_term)
+    
+    return df if mask.all() else df[mask]
+
+# Search terms made only of these characters are answered from the message index
+_WORD_TERM = re.compile(r'[A-Za-z0-9_]+')
+
+# An index holds about one int64 row label per word in the upload and is shared
+# by every session, so only the most recent uploads keep theirs
+@st.cache_resource(show_spinner=False, max_entries=3)
+def _message_index(file_id, _messages):
+    """
+    Inverted index of the lower-cased words in the messages, built once per upload.
+    
+    Returns the distinct words, the row labels of every word occurrence grouped
+    by word, and the offsets of each word's group. Cached as a resource so reruns
+    share the arrays instead of copying them.
+    """
+    words = _messages.str.lower().str.findall(r'\w+').explode().dropna()
+    codes, vocabulary = pd.factorize(words)
+    order = np.argsort(codes, kind='stable')
+    labels = words.index.to_numpy()[order]
+    offsets = np.searchsorted(codes[order], np.arange(len(vocabulary) + 1))
+    return pd.Series(vocabulary, dtype=object), labels, offsets
+
+def _indexed_matches(index, term):
+    """Row labels of the messages containing term (a single word), case-insensitively"""
+    vocabulary, labels, offsets = index
+    # Any occurrence of a word-character term lies inside one word of the message,
+    # so only the (few) distinct words need a substring scan
+    hits = np.flatnonzero(vocabulary.str.contains(term.lower(), regex=False).to_numpy())
+    if not len(hits):
+        return labels[:0]
+    return np.unique(np.concatenate([labels[offsets[h]:offsets[h + 1]] for h in hits]))
+
+# A search term without these is plain text, so no regex engine is needed
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+def _message_matches(messages, search_term):
+    """Case-insensitive search of the messages; returns a boolean mask"""
+    if pa is not None and not _REGEX_METACHARACTERS.intersection(search_term):
+        try:
+            mask = pc.match_substring(pa.array(messages, from_pandas=True), search_term, ignore_case=True)
+            return mask.fill_null(False).to_numpy(zero_copy_only=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # Not a plain string column; let pandas handle it
+    return messages.str.contains(search_term, case=False, na=False).to_numpy(dtype=bool)
+
+def _rows_digest(df):
+    """Fingerprint of which rows df holds; within one upload it identifies the filtered data"""
+    return hashlib.sha1(np.ascontiguousarray(df.index.to_numpy()).tobytes()).hexdigest()
+
+# Each entry is a full encoded copy of a filter result; keep only the latest few
+@st.cache_data(show_spinner=False, max_entries=2)
+def _to_csv_bytes(file_id, rows_digest, _df):
+    """Encode the filtered rows as CSV once per upload and filter result"""
+    return _df.to_csv(index=False).encode('utf-8')
+
+def _row_styles(df):
+    """CSS for every cell at once: error rows red, other warning rows yellow"""
+    no_rows = np.zeros(len(df), dtype=bool)
+    errors = df['has_error'].fillna(False).astype(bool).to_numpy() if 'has_error' in df.columns else no_rows
+    warnings = df['is_warning'].fillna(False).astype(bool).to_numpy() if 'is_warning' in df.columns else no_rows
     
+    row_css = np.where(errors, 'background-color: #fee',
+                       np.where(warnings, 'background-color: #fff3cd', ''))
+    return pd.DataFrame(np.repeat(row_css[:, None], len(df.columns), axis=1),
+                        index=df.index, columns=df.columns)
+
+def _display_frame(df):
+    """Select and format the columns shown in the table"""
     # Select columns to display
     display_columns = []
     available_columns = [
@@ -283,19 +587,30 @@ def style_dataframe(df):
         if col in df.columns:
             display_columns.append(col)
     
-    display_df = df[display_columns].copy()
+    # Reference the page's columns; only the reformatted ones become new data
+    columns = {col: df[col] for col in display_columns}
     
     # Format timestamp
-    if 'timestamp' in display_df.columns:
-        display_df['timestamp'] = display_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    if 'timestamp' in columns:
+        columns['timestamp'] = columns['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
     
     # Truncate long messages
-    if 'message' in display_df.columns:
-        display_df['message'] = display_df['message'].astype(str).apply(
-            lambda x: x[:200] + '...' if len(x) > 200 else x
-        )
+    if 'message' in columns:
+        messages = columns['message'].astype(str)
+        too_long = messages.str.len() > 200
+        columns['message'] = messages.where(~too_long, messages.str.slice(0, 200) + '...')
     
-    return display_df.style.apply(highlight_errors, axis=1)
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+# Pages are small, but every upload, filter result and page adds one
+@st.cache_data(show_spinner=False, max_entries=32)
+def _display_page(file_id, rows_digest, start_idx, end_idx, _page_df):
+    """Format one table page once per upload, filter result and page bounds"""
+    return _display_frame(_page_df)
+
+def style_dataframe(display_df):
+    """Apply styling to the formatted table page"""
+    return display_df.style.apply(_row_styles, axis=None)
 
 def main():
     """Main application"""
@@ -325,20 +640,29 @@ def main():
         if df is not None:
             st.success(f"✅ Loaded {len(df):,} log entries from {df['file_name'].nunique() if 'file_name' in df.columns else 'unknown'} files")
             
+            # Large uploads keep only a sample of rows, with whole-file counts alongside
+            precomputed = df.attrs.get('precomputed')
+            if precomputed:
+                st.info(f"📉 Large file: {precomputed['rows']:,} entries; filters and the table use a random sample of {len(df):,}")
+            
             # Apply filters
             st.sidebar.header("🎛️ Filters")
-            filtered_df = apply_filters(df)
+            filtered_df = apply_filters(df, _filter_options(uploaded_file.file_id, df), uploaded_file.file_id)
             
             # Show filtered count
             if len(filtered_df) != len(df):
                 st.info(f"🔍 Showing {len(filtered_df):,} of {len(df):,} entries after filtering")
             
+            # The whole-file counts only describe the unfiltered data
+            if filtered_df is not df:
+                precomputed = None
+            
             # Summary statistics
-            create_summary_stats(filtered_df)
+            create_summary_stats(filtered_df, precomputed)
             
             # Visualizations
             if len(filtered_df) > 0:
-                create_visualizations(filtered_df)
+                create_visualizations(filtered_df, precomputed)
                 
                 # Data table
                 st.subheader("📋 Log Entries")
@@ -353,10 +677,13 @@ def main():
                 end_idx = min(start_idx + entries_per_page, len(filtered_df))
                 
                 page_df = filtered_df.iloc[start_idx:end_idx]
+                rows_digest = _rows_digest(filtered_df)
                 
-                # Display styled dataframe
+                # Display styled dataframe; reruns that keep the page (another
+                # widget changed) reuse its formatted cells
                 if len(page_df) > 0:
-                    styled_df = style_dataframe(page_df)
+                    styled_df = style_dataframe(_display_page(uploaded_file.file_id, rows_digest,
+                                                              start_idx, end_idx, page_df))
                     st.dataframe(
                         styled_df,
                         width='stretch',
@@ -367,11 +694,9 @@ def main():
                     
                     # Download filtered data
                     if st.button("⬬ Download Filtered Data as CSV"):
-                        csv_buffer = io.StringIO()
-                        filtered_df.to_csv(csv_buffer, index=False)
                         st.download_button(
                             label="📥 Download CSV",
-                            data=csv_buffer.getvalue(),
+                            data=_to_csv_bytes(uploaded_file.file_id, rows_digest, filtered_df),
                             file_name=f"filtered_log_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                             mime="text/csv"
                         )
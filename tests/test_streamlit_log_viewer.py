@@ -0,0 +1,81 @@
+"""Tests for the Streamlit data viewer's CSV loading."""
+
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+STREAMLIT_AVAILABLE = importlib.util.find_spec('streamlit') is not None
+
+if STREAMLIT_AVAILABLE:
+    import streamlit_log_viewer as viewer
+
+CSV_HEADER = 'timestamp,log_level,file_name,message,has_error,is_warning\n'
+
+
+def make_csv(rows):
+    """CSV bytes with rows log entries, every third one an error."""
+    lines = [CSV_HEADER]
+    for i in range(rows):
+        level = 'ERROR' if i % 3 == 0 else 'INFO'
+        lines.append(f"2023-10-01 {9 + i % 5:02d}:{i % 60:02d}:00,{level},app{i % 4}.log,"
+                     f"message {i},{i % 3 == 0},False\n")
+    return ''.join(lines).encode('utf-8')
+
+
+@unittest.skipUnless(STREAMLIT_AVAILABLE, "streamlit is not installed")
+class SampledUploadTest(unittest.TestCase):
+    """Uploads above LARGE_UPLOAD_BYTES are read in chunks into a row sample."""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patches = [
+            mock.patch.object(viewer, 'LARGE_UPLOAD_BYTES', 1024),
+            mock.patch.object(viewer, 'SAMPLE_ROWS', 100),
+            mock.patch.object(viewer, 'CSV_CHUNK_ROWS', 64),
+            mock.patch.object(viewer, 'PARQUET_CACHE_DIR', Path(cache_dir.name)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        viewer._parse_csv.clear()
+        self.addCleanup(viewer._parse_csv.clear)
+
+    def test_counts_cover_every_row(self):
+        file_bytes = make_csv(1000)
+        df = viewer._parse_csv(file_bytes)
+        full = pd.read_csv(io.BytesIO(file_bytes))
+
+        self.assertEqual(len(df), 100)
+        precomputed = df.attrs['precomputed']
+        self.assertEqual(precomputed['rows'], 1000)
+        self.assertEqual(precomputed['errors'], int(full['has_error'].sum()))
+        self.assertEqual(dict(precomputed['level_counts']), full['log_level'].value_counts().to_dict())
+        self.assertEqual(dict(precomputed['file_counts']), full['file_name'].value_counts().to_dict())
+        self.assertEqual(sum(n for _, n in precomputed['error_hours']), int(full['has_error'].sum()))
+
+        # The sample holds genuine rows, in file order
+        self.assertTrue(df['message'].isin(full['message']).all())
+        numbers = df['message'].str.split().str[1].astype(int)
+        self.assertTrue(numbers.is_monotonic_increasing)
+
+    def test_header_only_upload(self):
+        file_bytes = CSV_HEADER.encode('utf-8') + b' ' * 2048  # Above the lowered threshold
+        df = viewer._read_csv_sampled(file_bytes)
+
+        self.assertEqual(len(df), 0)
+        self.assertEqual(list(df.columns), CSV_HEADER.strip().split(','))
+        self.assertEqual(df.attrs['precomputed']['rows'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
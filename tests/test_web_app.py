@@ -0,0 +1,48 @@
+"""Tests for the Flask web interface."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import web_app
+
+
+class XSendfileTest(unittest.TestCase):
+    """The --x-sendfile flag hands report downloads to the front-end server."""
+
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        for name in ('detailed_log_analysis_20231001_120000.csv', 'executive_summary_20231001_120000.txt'):
+            with open(os.path.join(self.output_dir.name, name), 'w') as f:
+                f.write('timestamp,log_level\n')
+        self.addCleanup(self.output_dir.cleanup)
+        self.addCleanup(web_app.app.config.update, USE_X_SENDFILE=web_app.app.config['USE_X_SENDFILE'])
+
+    def run_main(self, *flags):
+        argv = ['web_app.py', '--output', self.output_dir.name, *flags]
+        with mock.patch.object(sys, 'argv', argv), mock.patch.object(web_app.app, 'run'), \
+                mock.patch('builtins.print'):
+            web_app.main()
+        return web_app.app.test_client().get('/download/csv')
+
+    def test_flag_sends_x_sendfile_header(self):
+        response = self.run_main('--x-sendfile')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers['X-Sendfile'].endswith('.csv'))
+        self.assertEqual(response.get_data(), b'')
+        response.close()
+
+    def test_default_streams_the_file(self):
+        response = self.run_main()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Sendfile', response.headers)
+        self.assertEqual(response.get_data(), b'timestamp,log_level\n')
+        response.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,8 @@ Flask-based web application to view analysis results and download reports.
 
 import os
 import sys
-from flask import Flask, render_template_string, send_file, jsonify, request
+import functools
+from flask import Flask, send_file, jsonify, request
 from pathlib import Path
 import json
 from datetime import datetime
@@ -20,6 +21,24 @@ app = Flask(__name__)
 analysis_results = {}
 output_dir = None
 
+# Report file kind -> (name prefix, name suffix) written by main.py
+RESULT_FILES = {
+    'csv_file': ('detailed_log_analysis_', '.csv'),
+    'summary_file': ('executive_summary_', '.txt'),
+}
+
+def _scan_output_dir(output_path):
+    """Find the most recent report file of each kind in one directory pass."""
+    latest = {}
+    with os.scandir(output_path) as entries:
+        for entry in entries:
+            for kind, (prefix, suffix) in RESULT_FILES.items():
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file():
+                    ctime = entry.stat().st_ctime
+                    if kind not in latest or ctime > latest[kind][0]:
+                        latest[kind] = (ctime, entry.path)
+    return {kind: path for kind, (_, path) in latest.items()}
+
 def load_analysis_results(output_path):
     """Load analysis results from output directory."""
     global analysis_results, output_dir
@@ -27,13 +46,15 @@ def load_analysis_results(output_path):
     
     # Look for the most recent analysis results
     # This is a simplified version - in production you'd want better file management
-    csv_files = list(output_dir.glob("detailed_log_analysis_*.csv"))
-    summary_files = list(output_dir.glob("executive_summary_*.txt"))
+    try:
+        latest = _scan_output_dir(output_dir)
+    except OSError:
+        return False
     
-    if csv_files and summary_files:
+    if 'csv_file' in latest and 'summary_file' in latest:
         # Get the most recent files
-        latest_csv = max(csv_files, key=os.path.getctime)
-        latest_summary = max(summary_files, key=os.path.getctime)
+        latest_csv = latest['csv_file']
+        latest_summary = latest['summary_file']
         
         analysis_results = {
             'csv_file': str(latest_csv),
@@ -317,6 +338,43 @@ MAIN_TEMPLATE = """
 </html>
 """
 
+SUMMARY_TEMPLATE = """
+<html>
+<head>
+    <title>Executive Summary</title>
+    <style>
+        body { font-family: monospace; padding: 20px; background: #f5f5f5; }
+        .content { background: white; padding: 30px; border-radius: 8px; max-width: 800px; margin: 0 auto; }
+        hr { border: 1px solid #ddd; }
+        h2 { color: #2c3e50; }
+    </style>
+</head>
+<body>
+    <div class="content">
+        <pre>{{ content }}</pre>
+    </div>
+</body>
+</html>
+"""
+
+# Compile the page templates once at import; render_template_string would
+# re-parse and re-compile the source on every request
+_main_template = app.jinja_env.from_string(MAIN_TEMPLATE)
+_summary_template = app.jinja_env.from_string(SUMMARY_TEMPLATE)
+
+@functools.lru_cache(maxsize=8)
+def _render_summary(summary_file, mtime):
+    """
+    Render the executive summary page.
+    
+    mtime is the summary file's modification time; it only keys the cache, so
+    the page is rendered again once the report is regenerated.
+    """
+    with open(summary_file, 'r') as f:
+        content = f.read()
+    
+    return _summary_template.render(content=content)
+
 @app.route('/')
 def index():
     """Main dashboard page."""
@@ -325,15 +383,14 @@ def index():
     if has_results:
         # You would load actual analysis data here
         # For now, we'll use placeholder data
-        return render_template_string(MAIN_TEMPLATE, 
-                                    has_results=True,
-                                    analysis_date="2023-10-01",
-                                    total_entries="1,234",
-                                    total_errors="56",
-                                    error_rate="4.5%",
-                                    charts=analysis_results.get('charts', {}))
+        return _main_template.render(has_results=True,
+                                     analysis_date="2023-10-01",
+                                     total_entries="1,234",
+                                     total_errors="56",
+                                     error_rate="4.5%",
+                                     charts=analysis_results.get('charts', {}))
     else:
-        return render_template_string(MAIN_TEMPLATE, has_results=False)
+        return _main_template.render(has_results=False)
 
 @app.route('/download/<file_type>')
 def download_file(file_type):
@@ -341,6 +398,9 @@ def download_file(file_type):
     if not analysis_results:
         return "No analysis results available", 404
     
+    # send_file streams from disk (wsgi.file_wrapper/sendfile where the server
+    # offers it) and handles Range and conditional requests, so large CSVs never
+    # sit in memory and interrupted downloads can resume
     if file_type == 'csv' and 'csv_file' in analysis_results:
         return send_file(analysis_results['csv_file'], as_attachment=True)
     elif file_type == 'summary' and 'summary_file' in analysis_results:
@@ -386,36 +446,12 @@ def summary():
         return "Summary not available", 404
     
     summary_file = analysis_results['summary_file']
-    if os.path.exists(summary_file):
-        with open(summary_file, 'r') as f:
-            content = f.read()
-        
-        # Convert plain text to HTML with basic formatting
-        html_content = content.replace('\n', '<br>')
-        html_content = html_content.replace('━━━', '<hr>')
-        html_content = html_content.replace('#', '<h2>').replace('</h2>', '</h2>')
-        
-        html_template = f"""
-        <html>
-        <head>
-            <title>Executive Summary</title>
-            <style>
-                body {{ font-family: monospace; padding: 20px; background: #f5f5f5; }}
-                .content {{ background: white; padding: 30px; border-radius: 8px; max-width: 800px; margin: 0 auto; }}
-                hr {{ border: 1px solid #ddd; }}
-                h2 {{ color: #2c3e50; }}
-            </style>
-        </head>
-        <body>
-            <div class="content">
-                <pre>{content}</pre>
-            </div>
-        </body>
-        </html>
-        """
-        return html_template
+    try:
+        mtime = os.stat(summary_file).st_mtime
+    except OSError:
+        return "Summary not found", 404
     
-    return "Summary not found", 404
+    return _render_summary(summary_file, mtime)
 
 def main():
     """Main entry point for web application."""
@@ -428,9 +464,17 @@ def main():
                        help='Port to run the web server (default: 5000)')
     parser.add_argument('--host', type=str, default='127.0.0.1',
                        help='Host to bind the web server (default: 127.0.0.1)')
+    parser.add_argument('--x-sendfile', action='store_true',
+                       help='Let a front-end server with X-Sendfile support (Apache mod_xsendfile, '
+                            'lighttpd) send report files instead of Python')
     
     args = parser.parse_args()
     
+    # Under a WSGI server send_file already streams through wsgi.file_wrapper
+    # (sendfile) and answers conditional requests with 304; X-Sendfile hands the
+    # transfer to the front-end server, which the built-in server can't do
+    app.config['USE_X_SENDFILE'] = args.x_sendfile
+    
     # Load analysis results
     if load_analysis_results(args.output):
         print(f"✅ Analysis results loaded from: {args.output}")